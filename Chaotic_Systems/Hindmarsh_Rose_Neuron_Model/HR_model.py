@@ -1,27 +1,11 @@
+import sys
+from pathlib import Path
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
-# Hindmarsh-Rose model
-def hr(state, t, r, I):
-    x, y, z = state
-    dx = y + 3*x**2 - x**3 - z + I
-    dy = 1 - 5*x**2 - y
-    dz = r * (4*(x + 1.6) - z)
-    return np.array([dx, dy, dz])
-
-# Basic RK4 integrator
-def rk4(f, y0, t, r, I):
-    dt = t[1] - t[0]
-    y = np.zeros((len(t), len(y0)))
-    y[0] = y0
-    for i in range(1, len(t)):
-        k1 = f(y[i-1], t[i-1], r, I)
-        k2 = f(y[i-1] + 0.5*dt*k1, t[i-1] + 0.5*dt, r, I)
-        k3 = f(y[i-1] + 0.5*dt*k2, t[i-1] + 0.5*dt, r, I)
-        k4 = f(y[i-1] + dt*k3, t[i-1] + dt, r, I)
-        y[i] = y[i-1] + (dt/6)*(k1 + 2*k2 + 2*k3 + k4)
-    return y.T
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from chaos_core import rk4, hr
 
 # Parameters
 r = 0.005
@@ -29,12 +13,15 @@ I_values = [1.2, 2.0, 3.2, 3.9]
 initial_state = [-1.0, 0.0, 2.0]
 t = np.linspace(0, 1200, 20000)
 
+# All input currents integrate together as one ensemble
+sol = rk4(hr, initial_state, t, r, np.array(I_values))
+
 # Ploting
 fig = plt.figure(figsize=(20, 6 * len(I_values)))
 fig.suptitle("Hindmarsh-Rose Model Dynamics", fontsize=18)
 
 for i, I in enumerate(I_values):
-    x, y, z = rk4(hr, initial_state, t, r, I)
+    x, y, z = sol[:, i].T
     start = 0 if np.std(x[len(x)//2:]) < 0.1 else len(x) // 2
 
     # (a) Phase space x–y
@@ -1,64 +1,46 @@
-import numpy as np
+import sys
+from pathlib import Path
 from matplotlib import pyplot as plt
+from matplotlib.colors import to_rgb
+from matplotlib.lines import Line2D
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from chaos_core import rk4_chunks, lorenz_system, DensityGrid
 
-def rk4singlestep(f,dt,t0,y0):
-    k1 = f(t0,y0)
-    k2 = f(t0 + dt/2 ,y0 + (dt/2)*k1)
-    k3 = f(t0 + dt/2 ,y0 + (dt/2)*k2)
-    k4 = f(t0 + dt , y0 + dt*k3)
-    yout = y0 + (dt/6)*(k1+2*k2+2*k3+k4)
-    return yout
-    
 sigma = 10
 rho = 28
 beta = 8/3
 
-def lorentz(t,y):
-    dy = [
-        sigma*(y[1]-y[0]) ,
-        y[0]*(rho - y[2]) - y[1] ,
-        y[0]*y[1]-beta*y[2]
-    ]
-    return np.array(dy)
-
 y0 = [0,1,1]
 dt = 0.005
 T = 300
 nt = int(T/dt)
-t = np.linspace(0,T,nt)
-Y = np.zeros((nt,3))
-Y[0] = y0
-yin = y0
-
-for i in range(1,nt):
-    yin  = rk4singlestep(lorentz,dt,t[i-1],yin)
-    Y[i]= yin
 transient_cut = 30000
-Y_plot = Y[transient_cut:]
-t_plot = t[transient_cut:]
 
+# (columns, ranges, colour, labels) of the three projections
+panels = [
+    ((0, 1), ((-25, 25), (-30, 30)), 'red', ('x', 'y')),
+    ((1, 2), ((-30, 30), (0, 55)), 'green', ('y', 'z')),
+    ((2, 0), ((0, 55), (-25, 25)), 'blue', ('z', 'x')),
+]
+grids = [DensityGrid(1500, 1200, *ranges) for _, ranges, _, _ in panels]
+
+# Rasterize the trajectory chunk by chunk instead of keeping it
+for _, Y in rk4_chunks(lorenz_system, y0, sigma, rho, beta, dt=dt,
+                       n_steps=nt - 1 - transient_cut, n_transient=transient_cut):
+    for (cols, _, _, _), grid in zip(panels, grids):
+        grid.add_polyline(Y[:, cols])
+
+label = f'Initial: x0={y0[0]}, y0={y0[1]}, z0={y0[2]}'
 plt.figure(figsize=(18, 7))
-
-plt.subplot(1, 3, 1)
-plt.plot(Y_plot[:, 0], Y_plot[:, 1], color='red', lw=0.6, label=f'Initial: x0={y0[0]}, y0={y0[1]}, z0={y0[2]}')
-plt.xlabel('x')
-plt.ylabel('y')
-plt.title('x vs y')
-plt.legend()
-
-plt.subplot(1, 3, 2)
-plt.plot(Y_plot[:, 1], Y_plot[:, 2], color='green', lw=0.6, label=f'Initial: x0={y0[0]}, y0={y0[1]}, z0={y0[2]}')
-plt.xlabel('y')
-plt.ylabel('z')
-plt.title('y vs z')
-plt.legend()
-
-plt.subplot(1, 3, 3)
-plt.plot(Y_plot[:, 2], Y_plot[:, 0], color='blue', lw=0.6, label=f'Initial: x0={y0[0]}, y0={y0[1]}, z0={y0[2]}')
-plt.xlabel('z')
-plt.ylabel('x')
-plt.title('z vs x')
-plt.legend()
+for k, ((_, (xr, yr), color, (xl, yl)), grid) in enumerate(zip(panels, grids), start=1):
+    plt.subplot(1, 3, k)
+    plt.imshow(grid.image('log', color=to_rgb(color)),
+               extent=[*xr, *yr], aspect='auto')
+    plt.xlabel(xl)
+    plt.ylabel(yl)
+    plt.title(f'{xl} vs {yl}')
+    plt.legend(handles=[Line2D([], [], color=color, lw=0.6, label=label)])
 
 plt.tight_layout()
 plt.savefig('./lorentz_attractor_2d_subplots.png')
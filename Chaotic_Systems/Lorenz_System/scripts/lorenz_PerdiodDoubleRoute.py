@@ -1,50 +1,36 @@
+import sys
+from pathlib import Path
 import numpy as np
 import matplotlib.pyplot as plt
 
-# Define Lorenz system
-def lorenz_system(state, t, sigma, rho, beta):
-    x, y, z = state
-    dxdt = sigma * (y - x)
-    dydt = x * (rho - z) - y
-    dzdt = x * y - beta * z
-    return np.array([dxdt, dydt, dzdt])
-
-# RK4
-def rk4_step(f, state, t, dt, *params):
-    k1 = dt * f(state, t, *params)
-    k2 = dt * f(state + 0.5 * k1, t + 0.5 * dt, *params)
-    k3 = dt * f(state + 0.5 * k2, t + 0.5 * dt, *params)
-    k4 = dt * f(state + k3, t + dt, *params)
-    return state + (k1 + 2*k2 + 2*k3 + k4) / 6.0
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from chaos_core import rk4, lorenz_system, Sweep
+from chaos_core.sweep import DEFAULT_DIR as SWEEP_DIR
 
 # Solve and discard transients
 def solve_lorenz(rho, sigma=10.0, beta=8.0/3.0, 
                  x0=1.0, y0=1.0, z0=1.0, 
                  dt=0.005, n_steps=20000, n_transient=4000):
-    state = np.array([x0, y0, z0])
-    x_history = np.zeros(n_steps - n_transient)
-    y_history = np.zeros(n_steps - n_transient)
-    z_history = np.zeros(n_steps - n_transient)
-
-    for i in range(n_steps):
-        t = i * dt
-        state = rk4_step(lorenz_system, state, t, dt, sigma, rho, beta)
-        if i >= n_transient:
-            idx = i - n_transient
-            x_history[idx], y_history[idx], z_history[idx] = state
-
-    return x_history, y_history, z_history
+    t = np.arange(n_steps + 1) * dt
+    sol = rk4(lorenz_system, [x0, y0, z0], t, sigma, rho, beta)
+    kept = sol[n_transient + 1:]
+    return kept[:, 0], kept[:, 1], kept[:, 2]
 
 # Plot Lorenz attractors for different rho values
-def plot_lorenz_bifurcations(rho_values, save_path='lorenz_period_doubling.png'):
+def plot_lorenz_bifurcations(rho_values, save_path='lorenz_period_doubling.png',
+                             sweep_dir=SWEEP_DIR):
+    # Integrate every rho on all cores; finished runs are checkpointed under
+    # Chaotic_Systems/.sweep_cache (keyed on solve_lorenz and rho_values) so an
+    # interrupted job picks up where it stopped. sweep_dir=None disables it
+    sweep = Sweep(solve_lorenz, rho_values, sweep_dir).run()
+
     plt.style.use('seaborn-v0_8-whitegrid')
     fig = plt.figure(figsize=(16, 14))
     fig.suptitle('Lorenz System: Period-Doubling Route to Chaos', fontsize=22)
 
     for i, rho in enumerate(rho_values):
         ax = fig.add_subplot(2, 2, i + 1, projection='3d')
-        print(f"Simulating for rho = {rho}...")
-        x, y, z = solve_lorenz(rho=rho)
+        x, y, z = sweep.load(i)
 
         ax.plot(x, y, z, color='blue', lw=0.5, alpha=0.8)
         ax.set_title(f"$\\rho = {rho}$", fontsize=16)
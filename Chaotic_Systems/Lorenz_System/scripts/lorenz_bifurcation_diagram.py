@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+import numpy as np
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from chaos_core import lorenz_bifurcation
+
+# Bifurcation diagram: z maxima after transients for a dense rho grid
+def plot_lorenz_bifurcation_diagram(rho_min=140, rho_max=170, n_rho=3000,
+                                    save_path='lorenz_bifurcation_diagram.png'):
+    rho_values = np.linspace(rho_min, rho_max, n_rho)
+    rho, z_max = lorenz_bifurcation(rho_values)
+
+    plt.figure(figsize=(14, 8))
+    plt.plot(rho, z_max, ',', color='blue', alpha=0.5)
+    plt.xlabel(r'$\rho$', fontsize=14)
+    plt.ylabel(r'$z_{max}$', fontsize=14)
+    plt.title('Lorenz System: Bifurcation Diagram', fontsize=16)
+    plt.xlim(rho_min, rho_max)
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300)
+    print(f"Plot saved as '{save_path}'")
+    plt.show()
+
+if __name__ == '__main__':
+    plot_lorenz_bifurcation_diagram()
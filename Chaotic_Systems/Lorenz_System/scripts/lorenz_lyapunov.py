@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+import numpy as np
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from chaos_core import lorenz_lyapunov
+
+# Largest Lyapunov exponent over a rho grid (all rho values in one ensemble)
+def plot_lorenz_lyapunov(rho_min=140, rho_max=170, n_rho=600,
+                         save_path='lorenz_lyapunov.png'):
+    rho_values = np.linspace(rho_min, rho_max, n_rho)
+    lam1 = lorenz_lyapunov(rho_values, n_exponents=1)[:, 0]
+
+    plt.figure(figsize=(14, 6))
+    plt.plot(rho_values, lam1, color='blue', lw=0.8)
+    plt.axhline(0, color='black', lw=0.6, linestyle='--')
+    plt.xlabel(r'$\rho$', fontsize=14)
+    plt.ylabel(r'$\lambda_1$', fontsize=14)
+    plt.title('Lorenz System: Largest Lyapunov Exponent', fontsize=16)
+    plt.xlim(rho_min, rho_max)
+    plt.grid(True, linestyle=':', linewidth=0.7, alpha=0.8)
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300)
+    print(f"Plot saved as '{save_path}'")
+    plt.show()
+
+if __name__ == '__main__':
+    plot_lorenz_lyapunov()
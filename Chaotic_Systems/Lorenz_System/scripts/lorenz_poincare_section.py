@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from chaos_core import poincare_section, lorenz_system
+
+sigma = 10
+rho = 28
+beta = 8/3
+
+# Upward crossings of the plane z = rho - 1 (through both fixed points).
+# Only the crossing points are kept, so the run can be made very long.
+y0 = [0, 1, 1]
+dt = 0.005
+T = 20000
+transient = 50
+
+_, t_cross, P = poincare_section(lorenz_system, y0, sigma, rho, beta,
+                                 dt=dt, n_steps=int(T / dt),
+                                 n_transient=int(transient / dt),
+                                 plane=([0, 0, 1], rho - 1))
+
+plt.figure(figsize=(9, 8))
+plt.plot(P[:, 0], P[:, 1], '.', ms=1, color='blue')
+plt.xlabel('x')
+plt.ylabel('y')
+plt.title(f'Poincaré section z = {rho - 1} ({len(P)} crossings)')
+plt.tight_layout()
+plt.savefig('./lorenz_poincare_section.png', dpi=300)
+plt.show()
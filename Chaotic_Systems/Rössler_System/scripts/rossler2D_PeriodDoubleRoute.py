@@ -1,45 +1,31 @@
+import sys
+from pathlib import Path
 import numpy as np
 import matplotlib.pyplot as plt
 
-# Rössler system equations
-def rossler(state, t, a, b, c):
-    x, y, z = state
-    dxdt = -y - z
-    dydt = x + a * y
-    dzdt = b + z * (x - c)
-    return np.array([dxdt, dydt, dzdt])
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from chaos_core import cached_rk4, rossler
 
-# RK4 integration method
-def rk4(f, y0, t, a, b, c):
-    dt = t[1] - t[0]
-    y = np.zeros((len(t), len(y0)))
-    y[0] = y0
-    for i in range(1, len(t)):
-        k1 = f(y[i-1], t[i-1], a, b, c)
-        k2 = f(y[i-1] + 0.5*dt*k1, t[i-1] + 0.5*dt, a, b, c)
-        k3 = f(y[i-1] + 0.5*dt*k2, t[i-1] + 0.5*dt, a, b, c)
-        k4 = f(y[i-1] + dt*k3, t[i-1] + dt, a, b, c)
-        y[i] = y[i-1] + (dt/6)*(k1 + 2*k2 + 2*k3 + k4)
-    return y
-
-# Integrate and remove transient
+# Integrate (or load from the trajectory cache) and remove transient
+# (c may be an array: one column per value)
 def compute_rossler(a, b, c, initial_state, T=300, dt=0.01, transient=220):
-    t = np.arange(0, T, dt)
-    sol = rk4(rossler, initial_state, t, a, b, c)
-    cutoff = int(transient / dt)
-    return sol[cutoff:, 0], sol[cutoff:, 1], sol[cutoff:, 2]
+    sol = cached_rk4(rossler, initial_state, a, b, c, T=T, dt=dt, transient=transient)
+    return sol[..., 0], sol[..., 1], sol[..., 2]
 
 # Parameters and initial condition
 a, b = 0.1, 0.1
 initial_state = [0.1, 0.1, 0.1]
 c_values = [5, 6, 8, 9, 12, 18]
 
+# All c values integrate together as one ensemble
+X, Y, Z = compute_rossler(a, b, np.array(c_values), initial_state)
+
 # --- x–y projection ---
 fig_xy = plt.figure(figsize=(14, 10))
 plt.suptitle("Rössler Attractor: x–y Projection", fontsize=16)
 
 for idx, c in enumerate(c_values):
-    x, y, z = compute_rossler(a, b, c, initial_state)
+    x, y, z = X[:, idx], Y[:, idx], Z[:, idx]
     ax = fig_xy.add_subplot(3, 2, idx + 1)
     ax.plot(x, y, lw=0.5, color='red')
     ax.set_title(f"c = {c}", fontsize=11)
@@ -55,7 +41,7 @@ fig_yz = plt.figure(figsize=(14, 10))
 plt.suptitle("Rössler Attractor: y–z Projection", fontsize=16)
 
 for idx, c in enumerate(c_values):
-    x, y, z = compute_rossler(a, b, c, initial_state)
+    x, y, z = X[:, idx], Y[:, idx], Z[:, idx]
     ax = fig_yz.add_subplot(3, 2, idx + 1)
     ax.plot(y, z, lw=0.5, color='darkgreen')
     ax.set_title(f"c = {c}", fontsize=11)
@@ -71,7 +57,7 @@ fig_zx = plt.figure(figsize=(14, 10))
 plt.suptitle("Rössler Attractor: z–x Projection", fontsize=16)
 
 for idx, c in enumerate(c_values):
-    x, y, z = compute_rossler(a, b, c, initial_state)
+    x, y, z = X[:, idx], Y[:, idx], Z[:, idx]
     ax = fig_zx.add_subplot(3, 2, idx + 1)
     ax.plot(z, x, lw=0.5, color='navy')
     ax.set_title(f"c = {c}", fontsize=11)
@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+import numpy as np
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from chaos_core import rossler_bifurcation
+
+# Parameters
+a, b = 0.1, 0.1
+c_values = np.linspace(2, 18, 3000)
+
+# x maxima after transients for every c, integrated as one ensemble
+c, x_max = rossler_bifurcation(c_values, a=a, b=b)
+
+plt.figure(figsize=(14, 8))
+plt.plot(c, x_max, ',', color='darkblue', alpha=0.5)
+plt.xlabel("c", fontsize=14)
+plt.ylabel("$x_{max}$", fontsize=14)
+plt.title(f"Rössler System: Bifurcation Diagram (a={a}, b={b})", fontsize=16)
+plt.xlim(c_values[0], c_values[-1])
+plt.tight_layout()
+plt.savefig("rossler_bifurcation_diagram.png", dpi=300)
+plt.show()
@@ -0,0 +1,31 @@
+"""Shared numerics for the Chaotic_Systems scripts."""
+
+from .systems import (lorenz_system, rossler, hr, duffing,
+                      lorenz_jacobian, rossler_jacobian, hr_jacobian)
+from .integrators import rk4, ensemble, rk4_chunks
+from .adaptive import dopri5
+from .stiff import rosenbrock23, solve_hr_stiff
+from .cache import TrajectoryCache, cached_rk4
+from .sweep import Sweep
+from .poincare import poincare_section
+from .bifurcation import bifurcation_points, lorenz_bifurcation, rossler_bifurcation
+from .hr_network import HRNetwork, random_adjacency
+from .synchronization import (coupled_lorenz, coupled_rossler, sync_error,
+                              lorenz_sync_error, rossler_sync_error)
+from .msf import (master_stability, MSFSurface, msf_surface,
+                  lorenz_msf, rossler_msf, hr_msf)
+from .lyapunov import lyapunov_spectrum, lorenz_lyapunov, rossler_lyapunov, hr_lyapunov
+from .density import DensityGrid, tone_map, view_projection
+
+__all__ = ["lorenz_system", "rossler", "hr", "duffing",
+           "lorenz_jacobian", "rossler_jacobian", "hr_jacobian",
+           "rk4", "ensemble", "rk4_chunks", "dopri5", "rosenbrock23", "solve_hr_stiff",
+           "TrajectoryCache", "cached_rk4", "Sweep", "poincare_section",
+           "bifurcation_points", "lorenz_bifurcation", "rossler_bifurcation",
+           "lyapunov_spectrum", "lorenz_lyapunov", "rossler_lyapunov", "hr_lyapunov",
+           "HRNetwork", "random_adjacency",
+           "coupled_lorenz", "coupled_rossler", "sync_error",
+           "lorenz_sync_error", "rossler_sync_error",
+           "master_stability", "MSFSurface", "msf_surface",
+           "lorenz_msf", "rossler_msf", "hr_msf",
+           "DensityGrid", "tone_map", "view_projection"]
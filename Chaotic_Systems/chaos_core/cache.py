@@ -0,0 +1,148 @@
+"""
+Trajectory Cache
+================
+Content-addressed store for integrated trajectories, so that scripts plotting
+different projections of the same run integrate it only once.
+
+Entries are keyed on a SHA-256 of (system, parameters, initial state, dt, T,
+transient). Hits are served from a size-bounded in-memory LRU first, then from
+compressed `.npz` files on disk, which are themselves evicted least-recently-
+used once the directory exceeds its byte budget.
+"""
+
+import hashlib
+import json
+import os
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from .integrators import rk4
+
+DEFAULT_DIR = Path(__file__).resolve().parents[1] / ".trajectory_cache"
+
+
+def _canonical(value):
+    """JSON-safe, exactly round-tripping form of a scalar or array."""
+    arr = np.asarray(value, dtype=float)
+    return {"shape": list(arr.shape), "data": arr.ravel().tolist()}
+
+
+def trajectory_key(f, y0, params, dt, T, transient):
+    """Content hash identifying one integration request."""
+    payload = {
+        "system": f"{f.__module__}.{f.__qualname__}",
+        "params": [_canonical(p) for p in params],
+        "y0": _canonical(y0),
+        "dt": float(dt),
+        "T": float(T),
+        "transient": float(transient),
+    }
+    blob = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+class TrajectoryCache:
+    def __init__(self, directory=DEFAULT_DIR, max_memory_bytes=256 * 2**20,
+                 max_disk_bytes=2 * 2**30):
+        self.directory = Path(directory)
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+
+    def _path(self, key):
+        return self.directory / f"{key}.npz"
+
+    def get(self, key):
+        """Return the cached array for `key`, or None on a miss."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                arr = data["trajectory"]
+        except (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile):
+            path.unlink(missing_ok=True)    # truncated or corrupt: a miss
+            return None
+        os.utime(path)                  # mtime doubles as the disk LRU clock
+        self._remember(key, arr)
+        return arr
+
+    def put(self, key, arr):
+        """
+        Store a copy of `arr` under `key` in memory and on disk; returns the
+        stored, read-only copy (the caller's array stays writable).
+        """
+        arr = np.array(arr, order="C")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as fh:
+            np.savez_compressed(fh, trajectory=arr)
+        os.replace(tmp, path)
+        self._evict_disk()
+        self._remember(key, arr)
+        return arr
+
+    def clear(self):
+        """Drop every entry from memory and disk."""
+        self._memory.clear()
+        self._memory_bytes = 0
+        for path in self.directory.glob("*.npz"):
+            path.unlink()
+
+    def _remember(self, key, arr):
+        arr.setflags(write=False)       # shared between callers
+        if key in self._memory:
+            self._memory_bytes -= self._memory.pop(key).nbytes
+        if arr.nbytes > self.max_memory_bytes:
+            return
+        self._memory[key] = arr
+        self._memory_bytes += arr.nbytes
+        while self._memory_bytes > self.max_memory_bytes:
+            _, old = self._memory.popitem(last=False)
+            self._memory_bytes -= old.nbytes
+
+    def _evict_disk(self):
+        files = [(p.stat().st_mtime, p.stat().st_size, p)
+                 for p in self.directory.glob("*.npz")]
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink()
+            total -= size
+
+
+_default_cache = None
+
+
+def default_cache():
+    """Process-wide cache rooted at Chaotic_Systems/.trajectory_cache."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TrajectoryCache()
+    return _default_cache
+
+
+def cached_rk4(f, y0, *params, T, dt, transient=0.0, cache=None):
+    """
+    rk4() over t = arange(0, T, dt) with the first `transient` time units
+    dropped, served from the cache when the same request was made before.
+
+    The returned array is read-only.
+    """
+    cache = cache if cache is not None else default_cache()
+    key = trajectory_key(f, y0, params, dt, T, transient)
+    sol = cache.get(key)
+    if sol is None:
+        t = np.arange(0, T, dt)
+        sol = cache.put(key, rk4(f, y0, t, *params)[int(transient / dt):])
+    return sol
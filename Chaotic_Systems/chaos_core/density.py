@@ -0,0 +1,132 @@
+"""
+Density Rasterizer
+==================
+Accumulates point clouds and trajectories into a fixed 2-D count grid
+instead of handing them to matplotlib as markers or polylines. Input
+arrives chunk by chunk (e.g. from rk4_chunks or a chaos game), each chunk
+is binned with one np.bincount and then dropped, so memory is set by the
+image size and the cost is linear in the number of points, however many
+there are.
+
+Trajectories are drawn as segments: each one is sampled about once per
+pixel it crosses, with weights adding up to its length in pixels, so the
+density is ink per pixel, as a line plot would deposit, without alpha
+saturation. 3-D data is projected orthographically first (view_projection),
+with the same elevation/azimuth convention as matplotlib's 3-D axes.
+
+tone_map() turns the counts into an RGB image: linear, logarithmic or
+histogram-equalised intensity, through a colormap or a two-colour ramp.
+"""
+
+import numpy as np
+
+
+def view_projection(elev=30.0, azim=-60.0):
+    """(3, 2) matrix projecting xyz onto the screen of a matplotlib 3-D view."""
+    e, a = np.radians(elev), np.radians(azim)
+    right = np.array([-np.sin(a), np.cos(a), 0.0])
+    up = np.array([-np.sin(e) * np.cos(a), -np.sin(e) * np.sin(a), np.cos(e)])
+    return np.stack([right, up], axis=1)
+
+
+class DensityGrid:
+    def __init__(self, width, height, x_range, y_range):
+        """Counts over x_range × y_range; image orientation (row 0 = y max)."""
+        self.width, self.height = width, height
+        self.x_range = tuple(map(float, x_range))
+        self.y_range = tuple(map(float, y_range))
+        self.counts = np.zeros((height, width))
+
+    @classmethod
+    def around(cls, points, width, height=None, margin=0.05):
+        """
+        Grid framing `points` (a sample or bounding corners, (M, 2)) with a
+        relative margin. Without a height the aspect ratio of the data is
+        kept; with one, the shorter side is widened to square pixels.
+        """
+        points = np.asarray(points, dtype=float)
+        lo, hi = points.min(axis=0), points.max(axis=0)
+        pad = margin * (hi - lo).max()
+        lo, hi = lo - pad, hi + pad
+        span = hi - lo
+        if height is None:
+            height = max(1, int(round(width * span[1] / span[0])))
+        scale = max(span[0] / width, span[1] / height)
+        mid = (lo + hi) / 2
+        half = 0.5 * scale * np.array([width, height])
+        return cls(width, height, (mid[0] - half[0], mid[0] + half[0]),
+                   (mid[1] - half[1], mid[1] + half[1]))
+
+    def _pixels(self, xy):
+        """Continuous pixel coordinates (column, row) of (M, 2) points."""
+        xy = np.asarray(xy, dtype=float)
+        u = (xy[:, 0] - self.x_range[0]) / (self.x_range[1] - self.x_range[0]) * self.width
+        v = (self.y_range[1] - xy[:, 1]) / (self.y_range[1] - self.y_range[0]) * self.height
+        return u, v
+
+    def _bin(self, u, v, weights=None):
+        inside = (u >= 0) & (u < self.width) & (v >= 0) & (v < self.height)
+        idx = v[inside].astype(np.intp) * self.width + u[inside].astype(np.intp)
+        w = None if weights is None else np.broadcast_to(weights, u.shape)[inside]
+        self.counts += np.bincount(idx, weights=w,
+                                   minlength=self.counts.size).reshape(self.counts.shape)
+
+    def add_points(self, xy, weights=None):
+        """Add one count (or weight) per point of an (M, 2) chunk."""
+        self._bin(*self._pixels(xy), weights)
+        return self
+
+    def add_polyline(self, xy):
+        """
+        Add the segments joining consecutive rows of an (M, 2) chunk. Chunks
+        from rk4_chunks repeat the previous chunk's last state as out[0], so
+        feeding them in order draws one unbroken curve.
+        """
+        u, v = self._pixels(xy)
+        du, dv = np.diff(u), np.diff(v)
+        samples = np.maximum(np.ceil(np.maximum(np.abs(du), np.abs(dv))), 1).astype(np.intp)
+        seg = np.repeat(np.arange(du.size), samples)
+        start = np.cumsum(samples) - samples
+        frac = (np.arange(seg.size) - start[seg] + 0.5) / samples[seg]
+        weight = (np.hypot(du, dv) / samples)[seg]
+        self._bin(u[seg] + frac * du[seg], v[seg] + frac * dv[seg], weight)
+        return self
+
+    def image(self, method="log", **kwargs):
+        """RGB uint8 image of the counts, see tone_map()."""
+        return tone_map(self.counts, method, **kwargs)
+
+
+def tone_map(counts, method="log", cmap=None, color=(0.0, 0.0, 0.55),
+             background=(1.0, 1.0, 1.0)):
+    """
+    Map a count grid to an (H, W, 3) uint8 image.
+
+    method     : "linear" (c / max), "log" (log(1 + c) / log(1 + max)) or
+                 "eq" (histogram equalisation: rank among the non-empty pixels)
+    cmap       : callable taking intensities in [0, 1] to RGB(A), e.g. a
+                 matplotlib colormap; without one, intensity blends from
+                 `background` to `color`
+    Empty pixels are always `background`.
+    """
+    counts = np.asarray(counts, dtype=float)
+    filled = counts > 0
+    level = np.zeros_like(counts)
+    if filled.any():
+        if method == "linear":
+            level = counts / counts.max()
+        elif method == "log":
+            level = np.log1p(counts) / np.log1p(counts.max())
+        elif method == "eq":
+            ranked = np.sort(counts[filled])
+            level[filled] = np.searchsorted(ranked, counts[filled], side="right") / ranked.size
+        else:
+            raise ValueError(f"unknown tone mapping {method!r}")
+
+    background = np.asarray(background, dtype=float)
+    if cmap is None:
+        rgb = background + (np.asarray(color, dtype=float) - background) * level[..., None]
+    else:
+        rgb = np.asarray(cmap(level), dtype=float)[..., :3]
+        rgb[~filled] = background
+    return (np.clip(rgb, 0.0, 1.0) * 255).astype(np.uint8)
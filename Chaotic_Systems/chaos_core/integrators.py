@@ -0,0 +1,358 @@
+"""
+RK4 Integrator Engine
+=====================
+Fixed-step fourth-order Runge–Kutta used by every script in Chaotic_Systems.
+
+The trajectory is written into one preallocated buffer and the stage vectors
+live in scratch arrays that are reused on every step. The Lorenz, Rössler,
+Hindmarsh–Rose and forced Duffing systems additionally get fused kernels that run the whole loop
+on scalars: compiled with numba when it is installed, plain Python otherwise
+(still free of per-step array allocations).
+
+Ensembles: pass an (N, d) initial state and/or length-N parameter arrays and
+every member advances together in one RK4 step.
+"""
+
+import math
+
+import numpy as np
+
+from .systems import lorenz_system, rossler, hr, duffing
+
+try:
+    from numba import njit
+except ImportError:                     # numba is optional
+    njit = None
+
+
+def _fused(fn):
+    """Compile a scalar kernel with numba if available."""
+    return njit(cache=True)(fn) if njit is not None else fn
+
+
+# ─── Fused single steps (fixed-size systems) ──────────────────────────────────
+@_fused
+def _lorenz_step(x, y, z, dt, sigma, rho, beta):
+    h2 = 0.5 * dt
+    k1x = sigma * (y - x)
+    k1y = x * (rho - z) - y
+    k1z = x * y - beta * z
+    xs, ys, zs = x + h2 * k1x, y + h2 * k1y, z + h2 * k1z
+    k2x = sigma * (ys - xs)
+    k2y = xs * (rho - zs) - ys
+    k2z = xs * ys - beta * zs
+    xs, ys, zs = x + h2 * k2x, y + h2 * k2y, z + h2 * k2z
+    k3x = sigma * (ys - xs)
+    k3y = xs * (rho - zs) - ys
+    k3z = xs * ys - beta * zs
+    xs, ys, zs = x + dt * k3x, y + dt * k3y, z + dt * k3z
+    k4x = sigma * (ys - xs)
+    k4y = xs * (rho - zs) - ys
+    k4z = xs * ys - beta * zs
+    h6 = dt / 6.0
+    return (x + h6 * (k1x + 2 * k2x + 2 * k3x + k4x),
+            y + h6 * (k1y + 2 * k2y + 2 * k3y + k4y),
+            z + h6 * (k1z + 2 * k2z + 2 * k3z + k4z))
+
+
+@_fused
+def _rossler_step(x, y, z, dt, a, b, c):
+    h2 = 0.5 * dt
+    k1x = -y - z
+    k1y = x + a * y
+    k1z = b + z * (x - c)
+    xs, ys, zs = x + h2 * k1x, y + h2 * k1y, z + h2 * k1z
+    k2x = -ys - zs
+    k2y = xs + a * ys
+    k2z = b + zs * (xs - c)
+    xs, ys, zs = x + h2 * k2x, y + h2 * k2y, z + h2 * k2z
+    k3x = -ys - zs
+    k3y = xs + a * ys
+    k3z = b + zs * (xs - c)
+    xs, ys, zs = x + dt * k3x, y + dt * k3y, z + dt * k3z
+    k4x = -ys - zs
+    k4y = xs + a * ys
+    k4z = b + zs * (xs - c)
+    h6 = dt / 6.0
+    return (x + h6 * (k1x + 2 * k2x + 2 * k3x + k4x),
+            y + h6 * (k1y + 2 * k2y + 2 * k3y + k4y),
+            z + h6 * (k1z + 2 * k2z + 2 * k3z + k4z))
+
+
+@_fused
+def _hr_step(x, y, z, dt, r, I):
+    h2 = 0.5 * dt
+    x2 = x * x
+    k1x = y + 3 * x2 - x2 * x - z + I
+    k1y = 1 - 5 * x2 - y
+    k1z = r * (4 * (x + 1.6) - z)
+    xs, ys, zs = x + h2 * k1x, y + h2 * k1y, z + h2 * k1z
+    x2 = xs * xs
+    k2x = ys + 3 * x2 - x2 * xs - zs + I
+    k2y = 1 - 5 * x2 - ys
+    k2z = r * (4 * (xs + 1.6) - zs)
+    xs, ys, zs = x + h2 * k2x, y + h2 * k2y, z + h2 * k2z
+    x2 = xs * xs
+    k3x = ys + 3 * x2 - x2 * xs - zs + I
+    k3y = 1 - 5 * x2 - ys
+    k3z = r * (4 * (xs + 1.6) - zs)
+    xs, ys, zs = x + dt * k3x, y + dt * k3y, z + dt * k3z
+    x2 = xs * xs
+    k4x = ys + 3 * x2 - x2 * xs - zs + I
+    k4y = 1 - 5 * x2 - ys
+    k4z = r * (4 * (xs + 1.6) - zs)
+    h6 = dt / 6.0
+    return (x + h6 * (k1x + 2 * k2x + 2 * k3x + k4x),
+            y + h6 * (k1y + 2 * k2y + 2 * k3y + k4y),
+            z + h6 * (k1z + 2 * k2z + 2 * k3z + k4z))
+
+
+@_fused
+def _duffing_step(x, v, t, dt, delta, beta, alpha, gamma, omega):
+    h2 = 0.5 * dt
+    k1x = v
+    k1v = gamma * math.cos(omega * t) - delta * v - beta * x - alpha * x * x * x
+    xs, vs = x + h2 * k1x, v + h2 * k1v
+    f_mid = gamma * math.cos(omega * (t + h2))
+    k2x = vs
+    k2v = f_mid - delta * vs - beta * xs - alpha * xs * xs * xs
+    xs, vs = x + h2 * k2x, v + h2 * k2v
+    k3x = vs
+    k3v = f_mid - delta * vs - beta * xs - alpha * xs * xs * xs
+    xs, vs = x + dt * k3x, v + dt * k3v
+    k4x = vs
+    k4v = gamma * math.cos(omega * (t + dt)) - delta * vs - beta * xs - alpha * xs * xs * xs
+    h6 = dt / 6.0
+    return (x + h6 * (k1x + 2 * k2x + 2 * k3x + k4x),
+            v + h6 * (k1v + 2 * k2v + 2 * k3v + k4v))
+
+
+# ─── Fused loops ───────────────────────────────────────────────────────────────
+# One trajectory kernel (out: (n, d)) and one ensemble kernel
+# (out: (n, N, d), params: length-N arrays) per system. t holds the time of
+# each row of out; only the forced (non-autonomous) systems use it.
+
+@_fused
+def _lorenz_kernel(out, t, dt, sigma, rho, beta):
+    x, y, z = float(out[0, 0]), float(out[0, 1]), float(out[0, 2])
+    for i in range(1, out.shape[0]):
+        x, y, z = _lorenz_step(x, y, z, dt, sigma, rho, beta)
+        out[i, 0] = x
+        out[i, 1] = y
+        out[i, 2] = z
+
+
+@_fused
+def _lorenz_ensemble_kernel(out, t, dt, sigma, rho, beta):
+    for m in range(out.shape[1]):
+        x, y, z = out[0, m, 0], out[0, m, 1], out[0, m, 2]
+        for i in range(1, out.shape[0]):
+            x, y, z = _lorenz_step(x, y, z, dt, sigma[m], rho[m], beta[m])
+            out[i, m, 0] = x
+            out[i, m, 1] = y
+            out[i, m, 2] = z
+
+
+@_fused
+def _rossler_kernel(out, t, dt, a, b, c):
+    x, y, z = float(out[0, 0]), float(out[0, 1]), float(out[0, 2])
+    for i in range(1, out.shape[0]):
+        x, y, z = _rossler_step(x, y, z, dt, a, b, c)
+        out[i, 0] = x
+        out[i, 1] = y
+        out[i, 2] = z
+
+
+@_fused
+def _rossler_ensemble_kernel(out, t, dt, a, b, c):
+    for m in range(out.shape[1]):
+        x, y, z = out[0, m, 0], out[0, m, 1], out[0, m, 2]
+        for i in range(1, out.shape[0]):
+            x, y, z = _rossler_step(x, y, z, dt, a[m], b[m], c[m])
+            out[i, m, 0] = x
+            out[i, m, 1] = y
+            out[i, m, 2] = z
+
+
+@_fused
+def _hr_kernel(out, t, dt, r, I):
+    x, y, z = float(out[0, 0]), float(out[0, 1]), float(out[0, 2])
+    for i in range(1, out.shape[0]):
+        x, y, z = _hr_step(x, y, z, dt, r, I)
+        out[i, 0] = x
+        out[i, 1] = y
+        out[i, 2] = z
+
+
+@_fused
+def _hr_ensemble_kernel(out, t, dt, r, I):
+    for m in range(out.shape[1]):
+        x, y, z = out[0, m, 0], out[0, m, 1], out[0, m, 2]
+        for i in range(1, out.shape[0]):
+            x, y, z = _hr_step(x, y, z, dt, r[m], I[m])
+            out[i, m, 0] = x
+            out[i, m, 1] = y
+            out[i, m, 2] = z
+
+
+@_fused
+def _duffing_kernel(out, t, dt, delta, beta, alpha, gamma, omega):
+    x, v = float(out[0, 0]), float(out[0, 1])
+    for i in range(1, out.shape[0]):
+        x, v = _duffing_step(x, v, t[i - 1], dt,
+                             delta, beta, alpha, gamma, omega)
+        out[i, 0] = x
+        out[i, 1] = v
+
+
+@_fused
+def _duffing_ensemble_kernel(out, t, dt, delta, beta, alpha, gamma, omega):
+    for m in range(out.shape[1]):
+        x, v = out[0, m, 0], out[0, m, 1]
+        for i in range(1, out.shape[0]):
+            x, v = _duffing_step(x, v, t[i - 1], dt, delta[m], beta[m],
+                                 alpha[m], gamma[m], omega[m])
+            out[i, m, 0] = x
+            out[i, m, 1] = v
+
+
+FUSED_KERNELS = {
+    lorenz_system: _lorenz_kernel,
+    rossler: _rossler_kernel,
+    hr: _hr_kernel,
+    duffing: _duffing_kernel,
+}
+
+FUSED_ENSEMBLE_KERNELS = {
+    lorenz_system: _lorenz_ensemble_kernel,
+    rossler: _rossler_ensemble_kernel,
+    hr: _hr_ensemble_kernel,
+    duffing: _duffing_ensemble_kernel,
+}
+
+# State size each kernel unpacks; numba does not bounds-check, so any other
+# shape must take the generic path
+FUSED_DIMS = {lorenz_system: 3, rossler: 3, hr: 3, duffing: 2}
+
+
+# ─── Ensemble helpers ──────────────────────────────────────────────────────────
+def ensemble(y0, *params):
+    """
+    Broadcast an initial state and parameters to a common ensemble size.
+
+    Returns (y0, params) with y0 of shape (N, d) and every parameter a float
+    array of shape (N,). A single state with scalar parameters is returned
+    unchanged.
+    """
+    y0 = np.asarray(y0, dtype=float)
+    arrays = [np.asarray(p, dtype=float) for p in params]
+    if y0.ndim == 1 and all(p.ndim == 0 for p in arrays):
+        return y0, params
+
+    sizes = {p.shape[0] for p in arrays if p.ndim == 1}
+    if y0.ndim == 2:
+        sizes.add(y0.shape[0])
+    if len(sizes) > 1:
+        raise ValueError(f"Inconsistent ensemble sizes: {sorted(sizes)}")
+    n = sizes.pop()
+    y0 = np.array(np.broadcast_to(y0, (n, y0.shape[-1])))
+    return y0, tuple(np.broadcast_to(p, (n,)) for p in arrays)
+
+
+# ─── Generic RK4 ───────────────────────────────────────────────────────────────
+def rk4(f, y0, t, *params, out=None, dt=None):
+    """
+    Integrate y' = f(y, t, *params) over the uniform grid t with classic RK4.
+
+    y0 is a single state (d,) or an ensemble (N, d); parameters may be scalars
+    or length-N arrays (a single state is then copied to every member).
+    Returns an array of shape (len(t), d) or (len(t), N, d). Pass `out` to
+    reuse an existing buffer of that shape, and `dt` when t was built as
+    t0 + dt·k, so the step is exactly dt rather than t[1] - t[0] (which
+    picks up rounding that grows with t0).
+    """
+    t = np.asarray(t, dtype=float)
+    y0, params = ensemble(y0, *params)
+    if out is None:
+        out = np.empty((len(t),) + y0.shape)
+    out[0] = y0
+    if len(t) < 2:
+        return out
+    dt = float(t[1] - t[0]) if dt is None else float(dt)
+
+    fused = FUSED_DIMS.get(f) == y0.shape[-1]
+    if y0.ndim == 1 and fused:
+        # Python floats keep the pure-Python fallback off numpy scalars
+        FUSED_KERNELS[f](out, t, dt, *(float(p) for p in params))
+        return out
+    if y0.ndim == 2 and njit is not None and fused:
+        FUSED_ENSEMBLE_KERNELS[f](out, t, dt, *(np.ascontiguousarray(p) for p in params))
+        return out
+
+    # Vectorised NumPy path: any f, and ensembles when numba is unavailable
+    k1, k2, k3, k4, tmp = (np.empty_like(y0) for _ in range(5))
+    for i in range(1, len(t)):
+        y, ti = out[i - 1], t[i - 1]
+        k1[...] = f(y, ti, *params)
+        np.multiply(k1, 0.5 * dt, out=tmp)
+        tmp += y
+        k2[...] = f(tmp, ti + 0.5 * dt, *params)
+        np.multiply(k2, 0.5 * dt, out=tmp)
+        tmp += y
+        k3[...] = f(tmp, ti + 0.5 * dt, *params)
+        np.multiply(k3, dt, out=tmp)
+        tmp += y
+        k4[...] = f(tmp, ti + dt, *params)
+
+        yi = out[i]
+        np.add(k2, k3, out=yi)
+        yi *= 2
+        yi += k1
+        yi += k4
+        yi *= dt / 6
+        yi += y
+    return out
+
+
+# ─── Chunked streaming ─────────────────────────────────────────────────────────
+CHUNK_BYTES = 32 * 2**20               # target size of the rolling buffer
+
+
+def rk4_chunks(f, y0, *params, dt, n_steps, n_transient=0, t0=0.0,
+               chunk_steps=None):
+    """
+    Stream an RK4 run through one reusable buffer.
+
+    The first `n_transient` steps are integrated and discarded; the following
+    `n_steps` are yielded as (t, out) chunks, where out[0] repeats the last
+    state of the previous chunk so every step interval appears exactly once.
+    Both arrays are overwritten by the next chunk.
+    """
+    y, params = ensemble(y0, *params)
+    if chunk_steps is None:
+        chunk_steps = max(16, CHUNK_BYTES // (8 * y.size))
+    buf = np.empty((chunk_steps + 1,) + y.shape)
+
+    # Times come from the global step index and the step is passed as dt,
+    # so the result does not depend on how the run is cut into chunks
+    done = 0
+    for total, emit in ((n_transient, False), (n_steps, True)):
+        remaining = total
+        while remaining > 0:
+            steps = min(chunk_steps, remaining)
+            t = t0 + dt * (done + np.arange(steps + 1))
+            out = rk4(f, y, t, *params, out=buf[:steps + 1], dt=dt)
+            if emit:
+                yield t, out
+            y = out[-1].copy()
+            done += steps
+            remaining -= steps
+
+
+def hermite(y0, y1, f0, f1, h, theta):
+    """Cubic Hermite dense output on a step of length h at fraction theta."""
+    theta = np.asarray(theta)[..., None]
+    dy = y1 - y0
+    return (y0 + theta * dy
+            + theta * (theta - 1) * ((1 - 2 * theta) * dy
+                                     + (theta - 1) * h * f0 + theta * h * f1))
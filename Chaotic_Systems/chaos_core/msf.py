@@ -0,0 +1,209 @@
+"""
+Master Stability Function
+=========================
+Synchronizability of networks of identical oscillators
+
+    x_i' = f(x_i) - σ Σ_j L_ij H x_j,
+
+with Laplacian L and inner coupling matrix H (default: coupling through x).
+Near the synchronous state every Laplacian eigenmode γ_k obeys the same
+variational equation
+
+    ξ' = [Df(s(t)) - α H] ξ,    α = σ γ_k,
+
+so the largest Lyapunov exponent Λ(α) of that equation — the master stability
+function — decides stability for any topology: the network synchronizes when
+Λ(σ γ_k) < 0 for every non-zero mode.
+
+One reference trajectory s(t) drives a complex tangent vector per grid point
+of α, all advanced in the same RK4 step. The resulting surface is stored in
+the trajectory cache, after which checking a new spectrum is a lookup.
+"""
+
+import hashlib
+
+import numpy as np
+
+from .cache import default_cache, trajectory_key
+from .integrators import rk4_chunks
+from .sweep import code_hash
+from .systems import (lorenz_system, lorenz_jacobian, rossler, rossler_jacobian,
+                      hr, hr_jacobian)
+
+RK4_STABILITY = 2.5                     # max |α|·dt (RK4 limit is ≈2.8 on the axes)
+
+
+def _x_coupling(dim):
+    """H coupling the first component only."""
+    H = np.zeros((dim, dim))
+    H[0, 0] = 1.0
+    return H
+
+
+def master_stability(f, jac, y0, *params, alpha, coupling=None, dt, n_steps,
+                     n_transient=0, renorm_every=10, seed=0):
+    """
+    Largest transverse Lyapunov exponent Λ(α) for an array of complex α.
+
+    f, jac, y0, params : a single system, as for lyapunov_spectrum()
+    alpha              : complex coupling eigenvalues σγ, any shape
+    coupling           : inner coupling matrix H (default: x to x)
+    n_steps            : steps averaged over, after `n_transient` discarded
+                         steps of the reference trajectory
+
+    The -αH term is integrated explicitly, so |α|·dt must stay inside the RK4
+    stability region; a larger product raises ValueError instead of returning
+    a spurious positive Λ.
+
+    Returns Λ with the shape of alpha.
+    """
+    alpha = np.asarray(alpha, dtype=complex)
+    if np.abs(alpha).max(initial=0.0) * dt > RK4_STABILITY:
+        raise ValueError(f"|alpha| * dt = {np.abs(alpha).max() * dt:.3g} exceeds the "
+                         f"RK4 stability bound {RK4_STABILITY}; reduce dt")
+    y = np.asarray(y0, dtype=float)
+    dim = y.shape[-1]
+    H = _x_coupling(dim) if coupling is None else np.asarray(coupling, dtype=float)
+
+    if n_transient:
+        for _, out in rk4_chunks(f, y, *params, dt=dt, n_steps=1,
+                                 n_transient=n_transient):
+            y = out[-1].copy()
+    t = (n_transient + 1) * dt if n_transient else 0.0
+
+    a = alpha.reshape(-1, 1)
+    rng = np.random.default_rng(seed)
+    xi = rng.standard_normal((a.shape[0], dim)) + 1j * rng.standard_normal((a.shape[0], dim))
+    xi /= np.linalg.norm(xi, axis=-1, keepdims=True)
+
+    def rhs(y_, xi_, t_):
+        J = jac(y_, t_, *params)
+        return f(y_, t_, *params), xi_ @ J.T - a * (xi_ @ H.T)
+
+    log_sum = np.zeros(a.shape[0])
+    steps_done = 0
+    while steps_done < n_steps:
+        block = min(renorm_every, n_steps - steps_done)
+        for _ in range(block):
+            k1y, k1x = rhs(y, xi, t)
+            k2y, k2x = rhs(y + 0.5 * dt * k1y, xi + 0.5 * dt * k1x, t + 0.5 * dt)
+            k3y, k3x = rhs(y + 0.5 * dt * k2y, xi + 0.5 * dt * k2x, t + 0.5 * dt)
+            k4y, k4x = rhs(y + dt * k3y, xi + dt * k3x, t + dt)
+            y = y + (dt / 6) * (k1y + 2 * k2y + 2 * k3y + k4y)
+            xi = xi + (dt / 6) * (k1x + 2 * k2x + 2 * k3x + k4x)
+            t += dt
+        norm = np.linalg.norm(xi, axis=-1)
+        log_sum += np.log(norm)
+        xi /= norm[:, None]
+        steps_done += block
+
+    return (log_sum / (n_steps * dt)).reshape(alpha.shape)
+
+
+# ─── Cached surface ────────────────────────────────────────────────────────────
+class MSFSurface:
+    """Λ sampled on a uniform grid over Re α × Im α, with O(1) lookup per α."""
+
+    def __init__(self, re, im, values):
+        self.re, self.im = np.asarray(re, dtype=float), np.asarray(im, dtype=float)
+        self.values = np.asarray(values)            # (len(im), len(re))
+
+    def __call__(self, alpha):
+        """Bilinear interpolation of Λ at alpha; NaN outside the grid."""
+        alpha = np.asarray(alpha, dtype=complex)
+        u = self._index(alpha.real, self.re)
+        v = self._index(alpha.imag, self.im)
+        inside = np.isfinite(u) & np.isfinite(v)
+        u, v = np.where(inside, u, 0.0), np.where(inside, v, 0.0)
+        i = np.minimum(u.astype(int), max(len(self.re) - 2, 0))
+        j = np.minimum(v.astype(int), max(len(self.im) - 2, 0))
+        fu, fv = u - i, v - j
+        i1 = np.minimum(i + 1, len(self.re) - 1)
+        j1 = np.minimum(j + 1, len(self.im) - 1)
+        L = self.values
+        value = ((1 - fv) * ((1 - fu) * L[j, i] + fu * L[j, i1])
+                 + fv * ((1 - fu) * L[j1, i] + fu * L[j1, i1]))
+        return np.where(inside, value, np.nan)
+
+    @staticmethod
+    def _index(x, axis):
+        """Fractional index of x on a uniform axis; NaN when out of range."""
+        if len(axis) == 1:
+            return np.where(x == axis[0], 0.0, np.nan)
+        pos = (x - axis[0]) / (axis[1] - axis[0])
+        return np.where((pos >= 0) & (pos <= len(axis) - 1), pos, np.nan)
+
+    def transverse_exponents(self, eigenvalues, sigma=1.0):
+        """Λ(σγ_k) for every Laplacian eigenvalue except the zero (sync) mode."""
+        gamma = np.asarray(eigenvalues, dtype=complex).ravel()
+        gamma = np.delete(gamma, np.argmin(np.abs(gamma)))
+        return self(sigma * gamma)
+
+    def synchronizable(self, eigenvalues, sigma=1.0):
+        """True if every transverse mode has Λ < 0 (False if any lies off-grid)."""
+        return bool(np.all(self.transverse_exponents(eigenvalues, sigma) < 0))
+
+
+def _surface_key(f, jac, y0, params, dt, T, transient):
+    """
+    Cache key of an MSF surface: the trajectory key of the request plus the
+    Jacobian's qualified name and code hash, so a different or edited jac
+    never reads an old surface.
+    """
+    base = trajectory_key(f, y0, params, dt, T, transient)
+    ident = f"{base}:{jac.__module__}.{jac.__qualname__}:{code_hash(jac)}"
+    return hashlib.sha256(ident.encode()).hexdigest()
+
+
+def msf_surface(f, jac, y0, *params, re_range, im_range=(0.0, 0.0),
+                shape=(101, 1), coupling=None, dt=0.01, T=200, transient=50,
+                renorm_every=10, cache=None):
+    """
+    MSF over a uniform grid of α, served from the cache when computed before.
+
+    re_range, im_range : (min, max) of Re α and Im α
+    shape              : (n_re, n_im) grid points; n_im = 1 gives a real-axis
+                         MSF (undirected networks)
+    """
+    cache = cache if cache is not None else default_cache()
+    re = np.linspace(*re_range, shape[0])
+    im = np.linspace(*im_range, shape[1])
+    dim = np.shape(y0)[-1]
+    H = _x_coupling(dim) if coupling is None else np.asarray(coupling, dtype=float)
+
+    key = _surface_key(f, jac, y0, tuple(params) + (H, re, im, renorm_every),
+                       dt, T, transient)
+    values = cache.get(key)
+    if values is None:
+        alpha = re[None, :] + 1j * im[:, None]
+        n_transient = int(transient / dt)
+        values = master_stability(
+            f, jac, y0, *params, alpha=alpha, coupling=H, dt=dt,
+            n_steps=int(T / dt) - n_transient, n_transient=n_transient,
+            renorm_every=renorm_every)
+        values = cache.put(key, values)
+    return MSFSurface(re, im, values)
+
+
+# ─── System wrappers ───────────────────────────────────────────────────────────
+def lorenz_msf(re_range=(0.0, 20.0), im_range=(0.0, 0.0), shape=(201, 1),
+               sigma=10.0, rho=28.0, beta=8.0/3.0, y0=(1.0, 1.0, 1.0), **kwargs):
+    """MSF of x-coupled Lorenz oscillators."""
+    return msf_surface(lorenz_system, lorenz_jacobian, y0, sigma, rho, beta,
+                       re_range=re_range, im_range=im_range, shape=shape, **kwargs)
+
+
+def rossler_msf(re_range=(0.0, 5.0), im_range=(0.0, 0.0), shape=(201, 1),
+                a=0.2, b=0.2, c=5.7, y0=(1.0, 0.0, 0.0), **kwargs):
+    """MSF of x-coupled Rössler oscillators."""
+    return msf_surface(rossler, rossler_jacobian, y0, a, b, c,
+                       re_range=re_range, im_range=im_range, shape=shape, **kwargs)
+
+
+def hr_msf(re_range=(0.0, 2.0), im_range=(0.0, 0.0), shape=(201, 1),
+           r=0.005, I=3.2, y0=(-1.0, 0.0, 2.0), dt=0.02, T=2000, transient=500,
+           **kwargs):
+    """MSF of electrically (x-) coupled Hindmarsh–Rose neurons."""
+    return msf_surface(hr, hr_jacobian, y0, r, I, re_range=re_range,
+                       im_range=im_range, shape=shape, dt=dt, T=T,
+                       transient=transient, **kwargs)
@@ -0,0 +1,181 @@
+"""
+Parameter Sweep Runner
+======================
+Spreads a list of parameter points over a process pool. Checkpointing is
+opt-in: given a directory, every finished point is written to its own `.npz`
+file as soon as it completes, so an interrupted sweep resumes by skipping the
+points already on disk. Without one, results are only kept in memory.
+
+Each sweep checkpoints into its own subdirectory, named by a SHA-256 of the
+sweep definition — the function (qualified name, code and default
+arguments), the extra keyword arguments and the points — so editing the
+solver or the point list starts a fresh sweep instead of reusing stale
+results.
+
+Directory layout:
+    <directory>/<key>/sweep.json      — the sweep definition
+    <directory>/<key>/000000.npz ...  — one result per finished point, written atomically
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+from multiprocessing import Pool
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_DIR = Path(__file__).resolve().parents[1] / ".sweep_cache"
+
+
+def _point_to_json(point):
+    return np.asarray(point, dtype=float).tolist()
+
+
+def _argument_to_json(value):
+    """JSON-safe form of a keyword or default argument."""
+    if isinstance(value, (bool, str)) or value is None:
+        return value
+    if callable(value):
+        return f"{value.__module__}.{value.__qualname__}"
+    return _point_to_json(value)
+
+
+def code_hash(func):
+    """
+    SHA-256 of a function's code: bytecode, constants (recursing into nested
+    functions and comprehensions) and the global names it refers to, so
+    editing a literal or swapping a called helper changes the hash. None for
+    callables without Python code.
+    """
+    def feed(code):
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode())
+        for const in code.co_consts:
+            if hasattr(const, "co_code"):
+                feed(const)
+            else:
+                digest.update(repr(const).encode())
+
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return None
+    digest = hashlib.sha256()
+    feed(code)
+    return digest.hexdigest()
+
+
+def sweep_spec(func, points, kwargs):
+    """JSON-safe definition of a sweep: everything that determines its results."""
+    defaults = {name: _argument_to_json(p.default)
+                for name, p in inspect.signature(func).parameters.items()
+                if p.default is not inspect.Parameter.empty}
+    return {
+        "func": func.__qualname__,     # not __module__: "__main__" when run as a script
+        "code": code_hash(func),
+        "defaults": defaults,
+        "kwargs": {name: _argument_to_json(v) for name, v in kwargs.items()},
+        "points": [_point_to_json(p) for p in points],
+    }
+
+
+def _save_result(path, result):
+    """Atomically write a result (array or tuple of arrays) to `path`."""
+    arrays = result if isinstance(result, tuple) else (result,)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as fh:
+        np.savez(fh, *arrays, is_tuple=isinstance(result, tuple))
+    os.replace(tmp, path)
+
+
+def _run_point(task):
+    """Pool worker: evaluate one point, checkpointing its result if asked to."""
+    func, index, point, kwargs, directory = task
+    result = func(point, **kwargs)
+    if directory is None:
+        return index, result
+    _save_result(Path(directory) / f"{index:06d}.npz", result)
+    return index, None
+
+
+class Sweep:
+    def __init__(self, func, points, directory=None, kwargs=None):
+        """
+        func      : picklable (module-level) callable taking one point (and
+                    `kwargs`) and returning an array or a tuple of arrays
+        points    : sequence of parameter values (scalars or tuples)
+        directory : checkpoint root (e.g. DEFAULT_DIR), or None for no
+                    checkpoints; the same sweep resumes from the same root
+        kwargs    : extra keyword arguments passed to every call of func
+        """
+        self.func = func
+        self.points = list(points)
+        self.kwargs = dict(kwargs or {})
+        self._memory = {}
+        self.directory = None
+        if directory is not None:
+            spec = sweep_spec(func, self.points, self.kwargs)
+            blob = json.dumps(spec, sort_keys=True).encode()
+            self.directory = Path(directory) / hashlib.sha256(blob).hexdigest()[:16]
+            self.directory.mkdir(parents=True, exist_ok=True)
+            manifest = self.directory / "sweep.json"
+            if not manifest.exists():
+                manifest.write_text(json.dumps(spec, indent=2))
+
+    def _path(self, index):
+        return self.directory / f"{index:06d}.npz"
+
+    def _done(self, index):
+        if self.directory is None:
+            return index in self._memory
+        return self._path(index).exists()
+
+    def pending(self):
+        """Indices of points without a result yet."""
+        return [i for i in range(len(self.points)) if not self._done(i)]
+
+    def run(self, workers=None, verbose=True):
+        """Evaluate every pending point on `workers` processes (default: all cores)."""
+        todo = self.pending()
+        total = len(self.points)
+        if verbose and len(todo) < total:
+            print(f"Resuming sweep: {total - len(todo)}/{total} points already done")
+        if not todo:
+            return self
+
+        workers = workers or os.cpu_count()
+        chunksize = max(1, len(todo) // (workers * 32))
+        directory = None if self.directory is None else str(self.directory)
+        tasks = [(self.func, i, self.points[i], self.kwargs, directory) for i in todo]
+        done = total - len(todo)
+        with Pool(workers) as pool:
+            for index, result in pool.imap_unordered(_run_point, tasks, chunksize=chunksize):
+                if self.directory is None:
+                    self._memory[index] = result
+                done += 1
+                if verbose:
+                    print(f"[{done}/{total}] finished point {self.points[index]}")
+        return self
+
+    def load(self, index):
+        """Result for one point, in the shape `func` returned it."""
+        if self.directory is None:
+            return self._memory[index]
+        with np.load(self._path(index)) as data:
+            arrays = [data[f"arr_{k}"] for k in range(len(data.files) - 1)]
+            is_tuple = bool(data["is_tuple"])
+        return tuple(arrays) if is_tuple else arrays[0]
+
+    def results(self):
+        """Yield (point, result) for every finished point, in sweep order."""
+        for i, point in enumerate(self.points):
+            if self._done(i):
+                yield point, self.load(i)
+
+    def clear(self):
+        """Drop every result, deleting this sweep's checkpoint directory."""
+        self._memory.clear()
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,92 @@
+"""
+Synchronization of Coupled Systems
+==================================
+Pairs of identical Lorenz or Rössler systems with diffusive coupling on x,
+as in the Pluto notebooks of Synchronization_of_chaotic_systems. The pair
+lives in one 6-component state [x1, y1, z1, x2, y2, z2]: the first half is
+the drive, the second the response,
+
+    x2' = ... + k (x1 - x2)            (response)
+    x1' = ... + mutual · k (x2 - x1)   (drive; mutual = 0 is master–slave)
+
+Coupling strengths are ordinary ensemble parameters, so a whole grid of k
+values advances in the same RK4 step and sync_error() reduces the stream to
+one time-averaged error per k without keeping the trajectories.
+"""
+
+import numpy as np
+
+from .integrators import ensemble, rk4_chunks
+from .systems import lorenz_system, rossler
+
+
+def _couple(drive, response, f_drive, f_response, k, mutual):
+    """Add the x-coupling terms and join the two halves into one derivative."""
+    e = np.asarray(k) * (drive[..., 0] - response[..., 0])
+    f_drive[..., 0] -= mutual * e
+    f_response[..., 0] += e
+    return np.concatenate([f_drive, f_response], axis=-1)
+
+
+def coupled_lorenz(state, t, sigma, rho, beta, k, mutual=0.0):
+    """Two Lorenz systems coupled through x."""
+    state = np.asarray(state, dtype=float)
+    drive, response = state[..., :3], state[..., 3:]
+    return _couple(drive, response,
+                   lorenz_system(drive, t, sigma, rho, beta),
+                   lorenz_system(response, t, sigma, rho, beta), k, mutual)
+
+
+def coupled_rossler(state, t, a, b, c, k, mutual=0.0):
+    """Two Rössler systems coupled through x."""
+    state = np.asarray(state, dtype=float)
+    drive, response = state[..., :3], state[..., 3:]
+    return _couple(drive, response,
+                   rossler(drive, t, a, b, c),
+                   rossler(response, t, a, b, c), k, mutual)
+
+
+def sync_error(f, y0, *params, dt, n_steps, n_transient=0, component=0,
+               power=2, chunk_steps=None):
+    """
+    Time-averaged synchronization error of a coupled pair.
+
+    f, y0, params : as for rk4(), with y0 the joined (2d,) or (N, 2d) state
+    n_transient   : steps integrated and discarded before averaging
+    component     : compared state variable (0 = x)
+    power         : 2 for the mean squared error, 1 for the mean |x1 - x2|
+
+    Returns the mean of |drive - response|**power over the n_steps collected
+    steps: a scalar for a single run, shape (N,) for an ensemble.
+    """
+    y0, params = ensemble(y0, *params)
+    half = y0.shape[-1] // 2
+    total = np.zeros(y0.shape[:-1])
+    for _, out in rk4_chunks(f, y0, *params, dt=dt, n_steps=n_steps,
+                             n_transient=n_transient, chunk_steps=chunk_steps):
+        diff = out[1:, ..., component] - out[1:, ..., half + component]
+        total += (np.abs(diff) ** power).sum(axis=0)
+    return total / n_steps
+
+
+# ─── System wrappers ───────────────────────────────────────────────────────────
+def lorenz_sync_error(k_values, sigma=10.0, rho=28.0, beta=8.0/3.0, mutual=False,
+                      y0=(2.0, 1.0, 1.01, 0.0, 1.002, 0.01), dt=0.01, T=100,
+                      transient=20, power=2):
+    """Mean squared x-error of coupled Lorenz systems for every k in k_values."""
+    k_values = np.asarray(k_values, dtype=float)
+    n_transient = int(transient / dt)
+    return sync_error(coupled_lorenz, y0, sigma, rho, beta, k_values, float(mutual),
+                      dt=dt, n_steps=int(T / dt) - n_transient,
+                      n_transient=n_transient, power=power)
+
+
+def rossler_sync_error(k_values, a=0.2, b=0.2, c=5.7, mutual=False,
+                       y0=(1.0, 0.0, 0.0, 2.0, 1.0, 1.0), dt=0.01, T=200,
+                       transient=80, power=1):
+    """Mean |x1 - x2| of coupled Rössler systems for every k in k_values."""
+    k_values = np.asarray(k_values, dtype=float)
+    n_transient = int(transient / dt)
+    return sync_error(coupled_rossler, y0, a, b, c, k_values, float(mutual),
+                      dt=dt, n_steps=int(T / dt) - n_transient,
+                      n_transient=n_transient, power=power)
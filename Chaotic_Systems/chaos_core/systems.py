@@ -0,0 +1,105 @@
+"""
+Chaotic System Definitions
+Right-hand sides shared by the Lorenz, Rössler and Hindmarsh–Rose scripts,
+plus the forced Duffing oscillator from harmonic_and_duffing_oscillator.
+
+Every function accepts a single state of shape (d,) or an ensemble of shape
+(N, d); parameters (and t) may be scalars or length-N arrays, one per member.
+The `*_jacobian` functions return the matching (..., 3, 3) Jacobians used by
+the tangent-space (Lyapunov, master stability) calculations.
+"""
+
+import numpy as np
+
+
+def _jacobian_buffer(*arrays):
+    """Zeroed (..., d, d) array broadcast over the ensemble shape of the inputs."""
+    shape = np.broadcast_shapes(*(np.shape(a) for a in arrays))
+    return np.zeros(shape + (3, 3))
+
+
+def _components(state):
+    """Split the last axis of a state or ensemble into its components."""
+    state = np.asarray(state, dtype=float)
+    return tuple(state[..., i] for i in range(state.shape[-1]))
+
+
+# ─── Lorenz ────────────────────────────────────────────────────────────────────
+def lorenz_system(state, t, sigma, rho, beta):
+    """Lorenz equations."""
+    x, y, z = _components(state)
+    dxdt = sigma * (y - x)
+    dydt = x * (rho - z) - y
+    dzdt = x * y - beta * z
+    return np.stack([dxdt, dydt, dzdt], axis=-1)
+
+
+def lorenz_jacobian(state, t, sigma, rho, beta):
+    """Jacobian of the Lorenz equations, shape (..., 3, 3)."""
+    x, y, z = _components(state)
+    J = _jacobian_buffer(x, sigma, rho, beta)
+    J[..., 0, 0] = -sigma
+    J[..., 0, 1] = sigma
+    J[..., 1, 0] = rho - z
+    J[..., 1, 1] = -1
+    J[..., 1, 2] = -x
+    J[..., 2, 0] = y
+    J[..., 2, 1] = x
+    J[..., 2, 2] = -beta
+    return J
+
+
+# ─── Rössler ───────────────────────────────────────────────────────────────────
+def rossler(state, t, a, b, c):
+    """Rössler equations."""
+    x, y, z = _components(state)
+    dxdt = -y - z
+    dydt = x + a * y
+    dzdt = b + z * (x - c)
+    return np.stack([dxdt, dydt, dzdt], axis=-1)
+
+
+def rossler_jacobian(state, t, a, b, c):
+    """Jacobian of the Rössler equations, shape (..., 3, 3)."""
+    x, y, z = _components(state)
+    J = _jacobian_buffer(x, a, b, c)
+    J[..., 0, 1] = -1
+    J[..., 0, 2] = -1
+    J[..., 1, 0] = 1
+    J[..., 1, 1] = a
+    J[..., 2, 0] = z
+    J[..., 2, 2] = x - c
+    return J
+
+
+# ─── Hindmarsh–Rose ────────────────────────────────────────────────────────────
+def hr(state, t, r, I):
+    """Hindmarsh–Rose neuron model."""
+    x, y, z = _components(state)
+    dx = y + 3*x**2 - x**3 - z + I
+    dy = 1 - 5*x**2 - y
+    dz = r * (4*(x + 1.6) - z)
+    return np.stack([dx, dy, dz], axis=-1)
+
+
+def hr_jacobian(state, t, r, I):
+    """Jacobian of the Hindmarsh–Rose model, shape (..., 3, 3)."""
+    x, y, z = _components(state)
+    J = _jacobian_buffer(x, r, I)
+    J[..., 0, 0] = 6*x - 3*x**2
+    J[..., 0, 1] = 1
+    J[..., 0, 2] = -1
+    J[..., 1, 0] = -10*x
+    J[..., 1, 1] = -1
+    J[..., 2, 0] = 4*r
+    J[..., 2, 2] = -r
+    return J
+
+
+# ─── Forced Duffing ────────────────────────────────────────────────────────────
+def duffing(state, t, delta, beta, alpha, gamma, omega):
+    """Forced Duffing oscillator x'' + δx' + βx + αx³ = γ cos(ωt)."""
+    x, x_dot = _components(state)
+    forcing_term = gamma * np.cos(omega * t)
+    return np.stack(np.broadcast_arrays(
+        x_dot, forcing_term - delta * x_dot - beta * x - alpha * x**3), axis=-1)
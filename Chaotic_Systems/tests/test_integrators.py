@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from chaos_core import rk4_chunks, lorenz_system, duffing
+
+
+def _linear(y, t, k):
+    """Not a fused system: exercises the generic NumPy path."""
+    return -k * y + np.sin(t)
+
+
+def _run(f, y0, params, chunk_steps):
+    chunks = [(t.copy(), out.copy()) for t, out in
+              rk4_chunks(f, y0, *params, dt=0.01, n_steps=5000, n_transient=1234,
+                         t0=3.0, chunk_steps=chunk_steps)]
+    t = np.concatenate([chunks[0][0]] + [t[1:] for t, _ in chunks[1:]])
+    y = np.concatenate([chunks[0][1]] + [out[1:] for _, out in chunks[1:]])
+    return t, y
+
+
+@pytest.mark.parametrize("f, y0, params", [
+    (lorenz_system, [1.0, 1.0, 1.0], (10.0, 28.0, 8 / 3)),
+    (duffing, [0.1, 0.0], (0.2, -1.0, 1.0, 0.3, 1.2)),
+    (_linear, [1.0, -2.0], (0.5,)),
+    (lorenz_system, np.ones((3, 3)), (10.0, np.array([24.0, 28.0, 99.0]), 8 / 3)),
+])
+def test_rk4_chunks_does_not_depend_on_chunk_size(f, y0, params):
+    t_ref, y_ref = _run(f, y0, params, chunk_steps=5000)
+    for chunk_steps in (7, 333, 1024):
+        t, y = _run(f, y0, params, chunk_steps)
+        np.testing.assert_array_equal(t, t_ref)
+        np.testing.assert_array_equal(y, y_ref)
@@ -0,0 +1,24 @@
+"""Shared numerics for the Fractals scripts."""
+
+from .escape import (escape_time, mandelbrot_escape_time, escape_block, in_main_bulbs,
+                     smooth_iterations, shortcut_summary)
+from .tiles import render_escape, pixel_grid
+from .perturbation import perturbation_escape, reference_orbit
+from .palette import hls_to_rgb, to_uint8
+from .frames import FrameCache, frame_key, interpolate_path
+from .progressive import progressive_escape
+from .zoom import zoom_frames, write_image_sequence, write_video
+from .ifs import AffineIFS, sierpinski, barnsley_fern, chaos_game
+from .lsystem import LSystem, koch_snowflake
+from .geometry import binary_tree, cantor_levels, cantor_segments, level_polylines
+from .fields import FieldStore, field_key, save_field, load_field, recolor
+
+__all__ = ["escape_time", "mandelbrot_escape_time", "escape_block", "in_main_bulbs",
+           "smooth_iterations", "shortcut_summary", "render_escape", "pixel_grid",
+           "perturbation_escape", "reference_orbit", "hls_to_rgb", "to_uint8",
+           "FrameCache", "frame_key", "interpolate_path",
+           "progressive_escape", "zoom_frames", "write_image_sequence", "write_video",
+           "AffineIFS", "sierpinski", "barnsley_fern", "chaos_game",
+           "LSystem", "koch_snowflake", "binary_tree", "cantor_levels", "cantor_segments",
+           "level_polylines", "FieldStore", "field_key", "save_field", "load_field",
+           "recolor"]
@@ -0,0 +1,161 @@
+"""
+Escape-Time Kernel
+==================
+Iterates z ← z² + c for a whole grid of starting points while keeping only
+the still-bounded ("live") pixels: their z values, c values and flat indices
+sit in compacted arrays that shrink as pixels escape. The cost of an
+iteration is therefore proportional to the live pixel count rather than to
+the image size, and the escape test compares |z|² with R² so no square root
+is taken inside the loop.
+
+Interior shortcuts, for the pixels that would otherwise run all max_iter
+iterations:
+- main cardioid and period-2 bulb of the Mandelbrot set, tested analytically
+  before iterating;
+- Brent-style periodicity checking: each orbit is compared with a snapshot
+  retaken at iterations 32, 64, 128, …, and retired as bounded once it
+  returns to it, i.e. once it has settled on a cycle.
+
+Pass a dict as `stats` to have the number of pixels caught by each shortcut
+and the iterations they saved added to it.
+"""
+
+import numpy as np
+
+PERIOD_TOL = 1e-12                      # |z - snapshot| treated as a closed cycle
+PERIOD_START = 32                       # first snapshot; earlier iterations skip the check
+
+
+def _count(stats, **counts):
+    if stats is not None:
+        for key, value in counts.items():
+            stats[key] = stats.get(key, 0) + int(value)
+
+
+def escape_time(z0, c, max_iter, radius=2.0, periodicity=False, stats=None):
+    """
+    Escape iteration of every pixel.
+
+    z0          : starting values (any shape)
+    c           : scalar (Julia) or an array broadcastable to z0 (Mandelbrot)
+    periodicity : retire orbits that settle on a cycle as bounded
+    Returns (n, abs2) with the shape of z0: n is the number of updates after
+    which |z| first exceeded `radius` (tested after every update; -1 if it
+    stayed bounded for max_iter updates) and abs2 is |z|² at that moment.
+    """
+    z0 = np.asarray(z0, dtype=complex)
+    shape = z0.shape
+    z = z0.ravel().copy()
+    c = np.asarray(c, dtype=complex)
+    per_pixel = c.ndim > 0
+    if per_pixel:
+        c = np.broadcast_to(c, shape).ravel().copy()
+
+    n = np.full(z.size, -1, dtype=np.int32)
+    abs2 = np.zeros(z.size)
+    live = np.arange(z.size)
+    r2 = radius * radius
+    snapshot, next_snapshot = None, PERIOD_START
+    iterations = 0
+
+    for i in range(1, max_iter + 1):
+        np.multiply(z, z, out=z)
+        z += c
+        iterations += live.size
+        mod2 = z.real * z.real + z.imag * z.imag
+        done = mod2 > r2
+        if done.any():
+            n[live[done]] = i
+            abs2[live[done]] = mod2[done]
+        if snapshot is not None:
+            # cheap test on Re z first; Im z only for the few candidates
+            cycled = np.abs(z.real - snapshot.real) < PERIOD_TOL
+            if cycled.any():
+                k = np.flatnonzero(cycled)
+                cycled[k] = (np.abs(z.imag[k] - snapshot.imag[k]) < PERIOD_TOL) & ~done[k]
+                _count(stats, periodic=cycled.sum(),
+                       iterations_saved=cycled.sum() * (max_iter - i))
+                done |= cycled
+        if done.any():
+            keep = ~done
+            z, live = z[keep], live[keep]
+            if snapshot is not None:
+                snapshot = snapshot[keep]
+            if per_pixel:
+                c = c[keep]
+            if live.size == 0:
+                break
+        if periodicity and i == next_snapshot:
+            snapshot = z.copy()
+            next_snapshot *= 2
+
+    _count(stats, pixels=n.size, iterations=iterations)
+    return n.reshape(shape), abs2.reshape(shape)
+
+
+def escape_block(z, c, max_iter, radius=2.0, interior_checks=True, stats=None):
+    """
+    Escape times of a block of pixels: the Mandelbrot set when c is None
+    (z₀ = c = pixel, with its interior shortcuts), otherwise the Julia set of
+    c (z₀ = pixel, with periodicity checking if interior_checks).
+    """
+    if c is None:
+        return mandelbrot_escape_time(z, max_iter, radius, interior_checks, stats)
+    return escape_time(z, c, max_iter, radius, interior_checks, stats)
+
+
+def in_main_bulbs(c):
+    """True where c lies in the main cardioid or the period-2 bulb."""
+    c = np.asarray(c, dtype=complex)
+    x, y2 = c.real, c.imag * c.imag
+    q = (x - 0.25) ** 2 + y2
+    cardioid = q * (q + (x - 0.25)) <= 0.25 * y2
+    bulb = (x + 1) ** 2 + y2 <= 1 / 16
+    return cardioid, bulb
+
+
+def mandelbrot_escape_time(c, max_iter, radius=2.0, interior_checks=True,
+                           stats=None):
+    """
+    escape_time(c, c, ...) for the Mandelbrot set (z₀ = c).
+
+    With interior_checks, pixels in the main cardioid and period-2 bulb are
+    marked bounded without iterating and the rest use periodicity checking.
+    """
+    c = np.asarray(c, dtype=complex)
+    if not interior_checks:
+        return escape_time(c, c, max_iter, radius, stats=stats)
+
+    cardioid, bulb = in_main_bulbs(c)
+    bulb &= ~cardioid
+    _count(stats, cardioid=cardioid.sum(), bulb=bulb.sum(),
+           iterations_saved=(cardioid.sum() + bulb.sum()) * max_iter)
+    rest = ~(cardioid | bulb)
+    n = np.full(c.shape, -1, dtype=np.int32)
+    abs2 = np.zeros(c.shape)
+    n[rest], abs2[rest] = escape_time(c[rest], c[rest], max_iter, radius,
+                                      periodicity=True, stats=stats)
+    _count(stats, pixels=(~rest).sum())
+    return n, abs2
+
+
+def smooth_iterations(n, abs2):
+    """Continuous escape count n - log2(log2|z|); 0 for bounded pixels."""
+    smooth = np.zeros(np.shape(n))
+    escaped = n >= 0
+    log_z = 0.5 * np.log(abs2[escaped])
+    smooth[escaped] = n[escaped] - np.log(log_z / np.log(2)) / np.log(2)
+    return smooth
+
+
+def shortcut_summary(stats):
+    """One-line report of the pixels and iterations saved by the shortcuts."""
+    pixels = max(stats.get("pixels", 0), 1)
+    parts = [f"{stats.get(key, 0)} px ({stats.get(key, 0) / pixels:.1%}) {label}"
+             for key, label in (("cardioid", "in main cardioid"),
+                                ("bulb", "in period-2 bulb"),
+                                ("periodic", "periodic"))]
+    done = stats.get("iterations", 0)
+    saved = stats.get("iterations_saved", 0)
+    return (", ".join(parts) + f"; {saved:,} of {saved + done:,} iterations "
+            f"skipped ({saved / max(saved + done, 1):.1%})")
@@ -0,0 +1,135 @@
+"""
+Escape-Field Store
+==================
+Raw smooth escape values kept on disk, so that recoloring a render (palette,
+log scale, colour range) never re-runs the iteration.
+
+A field is a float32 `.npy` file, read back memory-mapped, with a small JSON
+sidecar describing what produced it: c, bounds, size, max_iter, escape
+radius and whatever else the caller passes. FieldStore names fields by a
+content hash of that metadata, so asking twice for the same view computes it
+once. As with the frame cache, the key does not cover the code, so clear()
+the store after changing how escape values are computed.
+
+recolor() is the separate colour stage: one vectorised pass from field
+values through a transfer function and a colormap lookup table to an RGB
+image, tens of milliseconds for a megapixel field.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from .frames import canonical
+
+DEFAULT_DIR = Path(__file__).resolve().parents[1] / ".field_cache"
+
+
+def field_key(**meta):
+    """Content hash identifying one escape field by its metadata."""
+    payload = {name: canonical(value) for name, value in meta.items()}
+    blob = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+def save_field(path, values, **meta):
+    """
+    Write `values` as float32 to `path` (.npy) and `meta` to the .json
+    sidecar next to it; returns the field re-opened read-only memory-mapped.
+    Complex metadata (c) is stored as [re, im].
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sidecar = path.with_suffix(".json")
+    tmp = sidecar.with_suffix(".tmp")
+    meta = {name: canonical(value) for name, value in meta.items()}
+    meta.update(shape=list(np.shape(values)), dtype="float32")
+    tmp.write_text(json.dumps(meta, indent=2, sort_keys=True))
+    os.replace(tmp, sidecar)
+
+    # The .npy appears last, under its final name, only once complete
+    tmp = path.with_suffix(".tmp")
+    out = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float32,
+                                    shape=np.shape(values))
+    out[...] = values
+    out.flush()
+    del out
+    os.replace(tmp, path)
+    return load_field(path)[0]
+
+
+def load_field(path):
+    """(values, meta) of a saved field; values are a read-only memmap."""
+    path = Path(path)
+    meta = json.loads(path.with_suffix(".json").read_text())
+    return np.load(path, mmap_mode="r"), meta
+
+
+class FieldStore:
+    def __init__(self, directory=DEFAULT_DIR):
+        self.directory = Path(directory)
+
+    def path(self, **meta):
+        """.npy path of a field (which need not exist yet)."""
+        return self.directory / f"{field_key(**meta)}.npy"
+
+    def field(self, compute, **meta):
+        """
+        The escape field described by `meta`, loaded memory-mapped when
+        stored, otherwise compute() and stored first.
+        """
+        path = self.path(**meta)
+        if path.exists():
+            return load_field(path)[0]
+        return save_field(path, compute(), **meta)
+
+    def clear(self):
+        """Delete every stored field and its sidecar."""
+        for pattern in ("*.npy", "*.json"):
+            for path in self.directory.glob(pattern):
+                path.unlink()
+
+
+def recolor(values, cmap, transform=None, vmin=None, vmax=None, bad=None):
+    """
+    Map an escape field to an (H, W, 3) uint8 image.
+
+    cmap       : callable taking [0, 1] to RGB(A), e.g. a matplotlib colormap;
+                 sampled once into a lookup table of cmap.N (else 256) colours
+    transform  : applied to the escaped values first (e.g. a log scale);
+                 levels it leaves non-finite take the first colour
+    vmin, vmax : colour range of the transformed values, default their extent;
+                 values outside take the end colours
+    bad        : colour of bounded pixels (field value 0); default the
+                 colormap's own bad colour (cmap.get_bad()), else black
+    """
+    values = np.asarray(values, dtype=np.float32)
+    interior = values == 0
+    level = np.zeros_like(values)
+    escaped = values[~interior]
+    if transform is not None:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            escaped = transform(escaped)
+    escaped = np.where(np.isfinite(escaped), escaped, -np.inf)   # -> first colour
+    level[~interior] = escaped
+    escaped = escaped[np.isfinite(escaped)]
+    if vmin is None:
+        vmin = escaped.min() if escaped.size else 0.0
+    if vmax is None:
+        vmax = escaped.max() if escaped.size else 1.0
+
+    size = getattr(cmap, "N", 256)
+    lut = np.asarray(cmap((np.arange(size) + 0.5) / size), dtype=float)[:, :3]
+    lut = (np.clip(lut, 0.0, 1.0) * 255).astype(np.uint8)
+    scale = size / (vmax - vmin) if vmax > vmin else 0.0
+    index = np.clip(np.nan_to_num((level - vmin) * scale, neginf=0.0), 0, size - 1)
+    index = index.astype(np.intp)
+    rgb = lut[index]
+    if bad is None:
+        bad = cmap.get_bad() if hasattr(cmap, "get_bad") else (0.0, 0.0, 0.0)
+    bad = np.asarray(bad, dtype=float)[:3]
+    rgb[interior] = (np.clip(bad, 0.0, 1.0) * 255).astype(np.uint8)
+    return rgb
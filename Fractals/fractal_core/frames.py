@@ -0,0 +1,120 @@
+"""
+Frame Cache
+===========
+Content-addressed store for rendered fractal frames, so that re-running an
+animation (e.g. while tweaking a Manim layout) only loads images from disk.
+
+A frame is described by a renderer — a module-level function returning a PIL
+image — and the keyword arguments it is called with. The SHA-256 of the
+cache's namespace, the renderer's qualified name and those arguments names a
+PNG file in the cache directory. The renderer's module is left out on
+purpose: a script run directly is "__main__", but a different module when
+imported (e.g. by manim), and both must find the same frames; the namespace
+string tells apart renderers of the same name in different scripts.
+
+render_frames() computes every missing frame of a list on a process pool,
+each worker writing its PNG atomically, and returns the paths in order. The
+key does not cover the renderer's code, so clear() the cache after changing
+how frames are drawn.
+"""
+
+import hashlib
+import json
+import os
+from multiprocessing import Pool
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_DIR = Path(__file__).resolve().parents[1] / ".frame_cache"
+
+
+def canonical(value):
+    """JSON-safe form of a frame argument; complex numbers become [re, im]."""
+    if isinstance(value, (tuple, list, np.ndarray)):
+        return [canonical(v) for v in value]
+    if isinstance(value, (complex, np.complexfloating)):
+        return [float(value.real), float(value.imag)]
+    if isinstance(value, (bool, np.bool_, str)) or value is None:
+        return value
+    return float(value)
+
+
+def frame_key(render, namespace="", **spec):
+    """Content hash identifying one frame: namespace, renderer and its arguments."""
+    payload = {
+        "namespace": namespace,
+        "render": render.__qualname__,
+        "spec": {name: canonical(value) for name, value in spec.items()},
+    }
+    blob = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+def interpolate_path(waypoints, steps):
+    """
+    Dense c values through a list of waypoints: `steps` values per segment,
+    ending on each waypoint. Returns a list of (segment, c) pairs, with the
+    first waypoint as (0, waypoints[0]).
+    """
+    waypoints = [complex(c) for c in waypoints]
+    dense = [(0, waypoints[0])]
+    for k, (a, b) in enumerate(zip(waypoints[:-1], waypoints[1:]), start=1):
+        dense += [(k, a * (1 - s / steps) + b * (s / steps))
+                  for s in range(1, steps + 1)]
+    return dense
+
+
+def _render_frame(task):
+    """Pool worker: render one frame and write its PNG atomically."""
+    render, spec, path = task
+    tmp = Path(path).with_suffix(".tmp")
+    render(**spec).save(tmp, format="PNG")
+    os.replace(tmp, path)
+    return path
+
+
+class FrameCache:
+    def __init__(self, namespace="", directory=DEFAULT_DIR):
+        """
+        namespace : stable name of the calling script, prefixed to every key
+        directory : where the PNG files live
+        """
+        self.namespace = namespace
+        self.directory = Path(directory)
+
+    def path(self, render, **spec):
+        """PNG path of a frame (which need not exist yet)."""
+        return self.directory / f"{frame_key(render, self.namespace, **spec)}.png"
+
+    def render_frames(self, render, specs, workers=None, verbose=True):
+        """
+        Paths of the frames render(**spec) for every spec, rendering the
+        missing ones on `workers` processes (default: all cores; 1 renders in
+        this process). `render` must be picklable, i.e. module-level.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        paths = [self.path(render, **spec) for spec in specs]
+        todo = {}
+        for spec, path in zip(specs, paths):
+            if not path.exists():
+                todo.setdefault(path, spec)       # identical frames render once
+        if todo:
+            if verbose:
+                print(f"Rendering {len(todo)} of {len(paths)} frames "
+                      f"({len(paths) - len(todo)} cached)")
+            tasks = [(render, spec, str(path)) for path, spec in todo.items()]
+            workers = workers or os.cpu_count()
+            if workers == 1:
+                for task in tasks:
+                    _render_frame(task)
+            else:
+                with Pool(workers) as pool:
+                    for _ in pool.imap_unordered(_render_frame, tasks):
+                        pass
+        return paths
+
+    def clear(self):
+        """Delete every cached frame."""
+        for path in self.directory.glob("*.png"):
+            path.unlink()
@@ -0,0 +1,85 @@
+"""
+Recursive Geometry
+==================
+Self-similar line fractals generated level by level as arrays instead of by
+recursion: every element of level d is derived from level d-1 in one
+vectorised step (rotation and scaling for tree branches, thirds for Cantor
+intervals). The result is an (N, 2, 2) segment array plus the level of each
+segment, ready for a single matplotlib LineCollection.
+"""
+
+import numpy as np
+
+
+def binary_tree(max_depth, start=(0.0, 0.0), length=1.0, angle=np.pi / 2,
+                scale=0.7, spread=np.pi / 6):
+    """
+    Branches of a binary fractal tree, levels 0 … max_depth.
+
+    Each branch ends where two children start, each `scale` times as long
+    and rotated by ±spread. Returns (segments, level): segments (N, 2, 2)
+    as [[x0, y0], [x1, y1]] with N = 2^(max_depth+1) - 1, level (N,).
+    """
+    n = 2 ** (max_depth + 1) - 1
+    segments = np.empty((n, 2, 2))
+    level = np.empty(n, dtype=np.int32)
+
+    x = np.array([float(start[0])])
+    y = np.array([float(start[1])])
+    theta = np.array([float(angle)])
+    offset = 0
+    for d in range(max_depth + 1):
+        x_end = x + length * np.cos(theta)
+        y_end = y + length * np.sin(theta)
+        block = slice(offset, offset + x.size)
+        segments[block, 0, 0], segments[block, 0, 1] = x, y
+        segments[block, 1, 0], segments[block, 1, 1] = x_end, y_end
+        level[block] = d
+        offset += x.size
+
+        # Children: both start at the parent's end, turned left and right
+        x, y = np.repeat(x_end, 2), np.repeat(y_end, 2)
+        theta = (theta[:, None] + np.array([spread, -spread])).ravel()
+        length *= scale
+    return segments, level
+
+
+def cantor_levels(depth, x=0.0, length=1.0):
+    """
+    Intervals of the first `depth` Cantor-set construction levels.
+
+    Returns a list of (left, right) array pairs, level 1 being [x, x+length].
+    """
+    left = np.array([float(x)])
+    levels = []
+    for _ in range(depth):
+        levels.append((left, left + length))
+        length /= 3
+        left = np.concatenate([left[:, None], left[:, None] + 2 * length], axis=1).ravel()
+    return levels
+
+
+def cantor_segments(depth, x=0.0, y=0.0, length=1.0, dy=1.0):
+    """Cantor levels as horizontal (N, 2, 2) segments, level k at y - (k-1)·dy."""
+    levels = cantor_levels(depth, x, length)
+    left = np.concatenate([l for l, _ in levels])
+    right = np.concatenate([r for _, r in levels])
+    height = np.concatenate([np.full(l.size, y - k * dy) for k, (l, _) in enumerate(levels)])
+    return np.stack([np.stack([left, height], axis=1),
+                     np.stack([right, height], axis=1)], axis=1)
+
+
+def level_polylines(segments, level):
+    """
+    Group segments into one NaN-separated polyline per level. Matplotlib
+    pays a fixed cost per path, so a LineCollection of a few long broken
+    paths (one linewidth per level) draws far faster than one of millions
+    of two-point paths.
+    """
+    polylines = []
+    for d in range(level.max() + 1):
+        block = segments[level == d]
+        path = np.full((block.shape[0], 3, 2), np.nan)
+        path[:, :2] = block
+        polylines.append(path.reshape(-1, 2)[:-1])
+    return polylines
@@ -0,0 +1,117 @@
+"""
+Iterated Function Systems
+=========================
+Chaos-game sampling of the attractor of an affine IFS
+
+    x ← A_k x + b_k,    map k drawn with probability p_k.
+
+Instead of one point hopping in a Python loop, an (N, 2) array of
+independent walkers advances together, with the map indices for a whole
+block of steps drawn in one call. After a short burn-in every walker is on
+the attractor (the maps are contractions), and the generator streams the
+visited points in fixed-size chunks, so 10^8–10^9 points can be accumulated
+into a histogram without ever being held in memory at once.
+"""
+
+import numpy as np
+
+BURN_IN = 64                            # discarded steps per walker
+
+
+class AffineIFS:
+    def __init__(self, matrices, offsets, probabilities=None):
+        """
+        matrices      : (k, 2, 2) linear parts A_k
+        offsets       : (k, 2) translations b_k
+        probabilities : (k,) map weights, normalised here; default: by
+                        |det A_k| (uniform density on the attractor for
+                        non-overlapping maps), equal weights if all are 0
+        """
+        self.matrices = np.asarray(matrices, dtype=float).reshape(-1, 2, 2)
+        self.offsets = np.asarray(offsets, dtype=float).reshape(-1, 2)
+        if len(self.matrices) != len(self.offsets):
+            raise ValueError("matrices and offsets must describe the same number of maps")
+        if probabilities is None:
+            probabilities = np.abs(np.linalg.det(self.matrices))
+            if not probabilities.any():
+                probabilities = np.ones(len(self.matrices))
+        p = np.asarray(probabilities, dtype=float)
+        if p.shape != (len(self.matrices),) or (p < 0).any() or p.sum() == 0:
+            raise ValueError("need one non-negative probability per map")
+        self.probabilities = p / p.sum()
+
+    @classmethod
+    def from_table(cls, rows):
+        """
+        Maps from the usual (a, b, c, d, e, f, p) rows:
+        x' = a x + b y + e, y' = c x + d y + f.
+        """
+        rows = np.asarray(rows, dtype=float)
+        return cls(rows[:, :4].reshape(-1, 2, 2), rows[:, 4:6], rows[:, 6])
+
+    def __len__(self):
+        return len(self.matrices)
+
+    def fixed_point(self, k=0):
+        """Fixed point of map k, a point of the attractor."""
+        return np.linalg.solve(np.eye(2) - self.matrices[k], self.offsets[k])
+
+
+def sierpinski(vertices=((0.0, 0.0), (1.0, 0.0), (0.5, np.sqrt(3) / 2))):
+    """Halfway-to-a-vertex maps, one per vertex (the Sierpiński triangle for three)."""
+    vertices = np.asarray(vertices, dtype=float)
+    return AffineIFS(np.repeat(0.5 * np.eye(2)[None], len(vertices), axis=0),
+                     vertices / 2, np.ones(len(vertices)))
+
+
+def barnsley_fern():
+    """Barnsley's fern with its classic coefficients."""
+    return AffineIFS.from_table([
+        (0.00, 0.00, 0.00, 0.16, 0.0, 0.00, 0.01),
+        (0.85, 0.04, -0.04, 0.85, 0.0, 1.60, 0.85),
+        (0.20, -0.26, 0.23, 0.22, 0.0, 1.60, 0.07),
+        (-0.15, 0.28, 0.26, 0.24, 0.0, 0.44, 0.07),
+    ])
+
+
+def chaos_game(ifs, n_points, walkers=4096, chunk=2**20, burn_in=BURN_IN, seed=None):
+    """
+    Yield the points of the chaos game as (m, 2) arrays, m = chunk except for
+    the last, n_points in total.
+
+    walkers : independent walkers advanced together; each chunk holds
+              chunk // walkers steps of all of them
+    burn_in : steps discarded before recording (start: map 0's fixed point
+              plus a small random spread)
+    """
+    rng = np.random.default_rng(seed)
+    cumulative = np.cumsum(ifs.probabilities)
+    a, b = ifs.matrices[:, 0, 0], ifs.matrices[:, 0, 1]
+    c, d = ifs.matrices[:, 1, 0], ifs.matrices[:, 1, 1]
+    e, f = ifs.offsets[:, 0], ifs.offsets[:, 1]
+
+    walkers = max(1, min(walkers, chunk))
+    steps = max(1, chunk // walkers)
+    start = ifs.fixed_point()
+    x = start[0] + 1e-3 * rng.standard_normal(walkers)
+    y = start[1] + 1e-3 * rng.standard_normal(walkers)
+
+    def draw(n_steps):
+        """Map indices for a block of steps, drawn at once."""
+        k = np.searchsorted(cumulative, rng.random((n_steps, walkers)), side="right")
+        return np.minimum(k, len(ifs) - 1)
+
+    for k in draw(burn_in):
+        x, y = a[k] * x + b[k] * y + e[k], c[k] * x + d[k] * y + f[k]
+
+    remaining = n_points
+    while remaining > 0:
+        n_steps = min(steps, -(-remaining // walkers))
+        out = np.empty((n_steps, walkers, 2))
+        for s, k in enumerate(draw(n_steps)):
+            x, y = a[k] * x + b[k] * y + e[k], c[k] * x + d[k] * y + f[k]
+            out[s, :, 0] = x
+            out[s, :, 1] = y
+        points = out.reshape(-1, 2)[:remaining]
+        remaining -= len(points)
+        yield points
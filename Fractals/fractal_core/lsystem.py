@@ -0,0 +1,148 @@
+"""
+L-Systems
+=========
+Turtle drawing of (non-branching) L-systems without building the expanded
+string. A turtle path is fully described by the heading of each drawn
+segment, and the headings produced by a symbol expanded d times do not
+depend on where that symbol sits — only shifted by the turtle's heading on
+arrival. So, for every (symbol, depth), a table holds
+
+    count — number of segments drawn,
+    turn  — net heading change,
+    heads — heading of each segment relative to the entry heading,
+
+built bottom-up from the rules, the deeper arrays by concatenating shifted
+copies of shallower ones. Headings are integer multiples of the turn
+angle, looked up in a table of unit vectors, and the coordinates are one
+cumulative sum into a preallocated array.
+
+For paths too long to hold, coordinate_chunks() walks the rule tree with a
+recursive generator, using the tables only for subtrees that fit in a
+chunk, and yields fixed-size pieces of the path (e.g. for DensityGrid).
+"""
+
+import numpy as np
+
+
+class LSystem:
+    def __init__(self, axiom, rules, angle, draw="F"):
+        """
+        axiom, rules : start string and {symbol: replacement} productions
+        angle        : turn of '+' (counter-clockwise) and '-' in degrees
+        draw         : symbols that move the turtle forward drawing a segment;
+                       other symbols without a rule are ignored
+        """
+        if "[" in axiom or any("[" in body for body in rules.values()):
+            raise ValueError("branching L-systems ([ ]) are not supported")
+        self.axiom, self.rules, self.draw = axiom, dict(rules), set(draw)
+        self.angle = float(angle)
+        turns = 360.0 / self.angle
+        # Heading table: exact when the angle divides the full turn
+        self.n_headings = int(round(turns)) if np.isclose(turns, round(turns)) else None
+        self._tables, self._totals = {}, {}
+
+    # ─── Segment tables ─────────────────────────────────────────────────────
+    def _total(self, symbol, depth):
+        """(count, turn) of `symbol` expanded `depth` times, without the heads."""
+        key = (symbol, depth)
+        if key not in self._totals:
+            if depth > 0 and symbol in self.rules:
+                count, turn = 0, 0
+                for s in self.rules[symbol]:
+                    c, t = self._total(s, depth - 1)
+                    count, turn = count + c, turn + t
+                self._totals[key] = (count, self._wrap(turn))
+            else:
+                self._totals[key] = (int(symbol in self.draw),
+                                     {"+": 1, "-": -1}.get(symbol, 0))
+        return self._totals[key]
+
+    def _symbol(self, symbol, depth):
+        """(count, turn, heads) of `symbol` expanded `depth` times."""
+        key = (symbol, depth)
+        if key not in self._tables:
+            if depth > 0 and symbol in self.rules:
+                self._tables[key] = self._string(self.rules[symbol], depth - 1)
+            elif symbol in self.draw:
+                self._tables[key] = (1, 0, np.zeros(1, dtype=np.int64))
+            else:
+                turn = {"+": 1, "-": -1}.get(symbol, 0)
+                self._tables[key] = (0, turn, np.zeros(0, dtype=np.int64))
+        return self._tables[key]
+
+    def _string(self, string, depth):
+        """(count, turn, heads) of a string whose symbols are expanded `depth` times."""
+        parts, turn = [], 0
+        for symbol in string:
+            count, sym_turn, heads = self._symbol(symbol, depth)
+            if count:
+                parts.append(self._wrap(heads + turn))
+            turn += sym_turn
+        heads = np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+        return heads.size, self._wrap(turn), heads
+
+    def _wrap(self, heading):
+        return heading % self.n_headings if self.n_headings else heading
+
+    def segment_count(self, iterations):
+        """Number of segments the path draws after `iterations` rewrites."""
+        return sum(self._total(s, iterations)[0] for s in self.axiom)
+
+    # ─── Coordinates ────────────────────────────────────────────────────────
+    def _steps(self, heads, step):
+        """Displacement of each segment from its heading index."""
+        if self.n_headings:
+            phi = np.radians(self.angle * np.arange(self.n_headings))
+            table = step * np.stack([np.cos(phi), np.sin(phi)], axis=1)
+            return table[heads]
+        phi = np.radians(self.angle * heads)
+        return step * np.stack([np.cos(phi), np.sin(phi)], axis=1)
+
+    def coordinates(self, iterations, step=1.0, start=(0.0, 0.0)):
+        """(n + 1, 2) vertices of the path, turtle starting east at `start`."""
+        _, _, heads = self._string(self.axiom, iterations)
+        coords = np.empty((heads.size + 1, 2))
+        coords[0] = start
+        np.cumsum(self._steps(heads, step), axis=0, out=coords[1:])
+        coords[1:] += coords[0]
+        return coords
+
+    def coordinate_chunks(self, iterations, step=1.0, start=(0.0, 0.0), chunk=2**20):
+        """
+        Yield the path as (m + 1, 2) vertex arrays of up to `chunk` segments;
+        each starts with the last vertex of the previous one, so the pieces
+        join into one polyline.
+        """
+        def walk(string, depth, turn):
+            for symbol in string:
+                count, sym_turn = self._total(symbol, depth)
+                if count > chunk and depth > 0 and symbol in self.rules:
+                    yield from walk(self.rules[symbol], depth - 1, turn)
+                elif count:
+                    yield self._wrap(self._symbol(symbol, depth)[2] + turn)
+                turn += sym_turn
+
+        position = np.asarray(start, dtype=float)
+        pending, size = [], 0
+        for heads in walk(self.axiom, iterations, 0):
+            pending.append(heads)
+            size += heads.size
+            if size >= chunk:
+                heads = np.concatenate(pending)
+                pending, size = [heads[chunk:]], heads.size - chunk
+                position = yield from self._emit(heads[:chunk], step, position)
+        if size:
+            yield from self._emit(np.concatenate(pending), step, position)
+
+    def _emit(self, heads, step, position):
+        coords = np.empty((heads.size + 1, 2))
+        coords[0] = position
+        np.cumsum(self._steps(heads, step), axis=0, out=coords[1:])
+        coords[1:] += position
+        yield coords
+        return coords[-1].copy()
+
+
+def koch_snowflake():
+    """Koch snowflake: three Koch curves on a triangle."""
+    return LSystem("F++F++F", {"F": "F-F++F-F"}, angle=60)
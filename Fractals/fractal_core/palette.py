@@ -0,0 +1,35 @@
+"""
+Palettes
+========
+Array versions of the per-pixel colour conversions used by the scripts, so an
+escape-time field is turned into an RGB image in a few NumPy operations
+instead of one `colorsys` call per pixel.
+"""
+
+import numpy as np
+
+
+def _hls_channel(m1, m2, hue):
+    """colorsys._v for arrays: one RGB channel of an HLS colour."""
+    hue = hue % 1.0
+    return np.select(
+        [hue < 1 / 6, hue < 0.5, hue < 2 / 3],
+        [m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (2 / 3 - hue) * 6.0],
+        default=m1)
+
+
+def hls_to_rgb(h, l, s):
+    """colorsys.hls_to_rgb over arrays; returns (..., 3) floats in [0, 1]."""
+    h, l, s = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (h, l, s)))
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - l * s)
+    m1 = 2.0 * l - m2
+    rgb = np.stack([_hls_channel(m1, m2, h + 1 / 3),
+                    _hls_channel(m1, m2, h),
+                    _hls_channel(m1, m2, h - 1 / 3)], axis=-1)
+    grey = (s == 0.0)[..., None]
+    return np.where(grey, l[..., None], rgb)
+
+
+def to_uint8(rgb):
+    """(..., 3) floats in [0, 1] → uint8, truncating like int(v * 255)."""
+    return (np.clip(rgb, 0.0, 1.0) * 255).astype(np.uint8)
@@ -0,0 +1,151 @@
+"""
+Progressive Rendering
+=====================
+Coarse-to-fine escape-time render for interactive previews. A generator
+yields the image after every refinement level, starting with a coarse
+lattice of samples (a few thousand pixels) that is ready almost at once.
+Every sample computed along the way is kept; nothing is computed twice.
+
+Refinement is Mariani–Silver subdivision. The grid lines between lattice
+points are computed at full resolution, splitting the image into s × s
+cells with known borders. A cell whose whole border stayed bounded is filled
+as bounded without iterating its interior; any other cell is split into four
+by computing the cross through its centre, and so on down to single pixels.
+Since the Mandelbrot set is connected, a bounded border encloses only
+bounded points, except for escaping filaments thinner than a pixel that slip
+between border samples (a handful of pixels per megapixel). For Julia sets
+the fill is the usual heuristic: it can also miss escaping specks that never
+touch the border.
+
+With smooth=False cells whose border shares one escape count are filled too
+(with that count), which suits banded palettes but not smooth colouring.
+"""
+
+import numpy as np
+
+from .escape import escape_block
+
+PREVIEW_CELLS = 64                      # coarse lattice spans ≈ this many steps
+
+
+def _axis(lo, hi, size, padded):
+    """pixel_grid() axis extended with the same spacing to `padded` points."""
+    axis = np.linspace(lo, hi, size)
+    step = (hi - lo) / max(size - 1, 1)
+    return np.concatenate([axis, lo + step * np.arange(size, padded)])
+
+
+def _start_step(width, height):
+    """Power-of-two lattice step giving about PREVIEW_CELLS cells across."""
+    step = 1
+    while step * PREVIEW_CELLS < max(width, height):
+        step *= 2
+    return step
+
+
+def progressive_escape(x_range, y_range, width, height, c=None, max_iter=1024,
+                       radius=2.0, interior_checks=True, smooth=True, step=None,
+                       stats=None):
+    """
+    Yield (step, n, abs2) after each refinement level of a render_escape()
+    view (same grid, same c / interior_checks meaning).
+
+    step : lattice step of the preview, rounded up to a power of two (each
+           level halves it); pixels not computed yet show the sample at the
+           top-left corner of their step × step cell. The last item has
+           step 1 and is the finished image.
+    stats: optional dict receiving "computed" and "filled" pixel counts
+           (plus the escape kernel's own counters)
+
+    n and abs2 are fresh (height, width) arrays on every yield.
+    """
+    if step is None:
+        step = _start_step(width, height)
+    elif step < 1:
+        raise ValueError(f"step must be >= 1, got {step}")
+    else:
+        step = 1 << (int(step) - 1).bit_length()
+    Wp = -(-(width - 1) // step) * step + 1
+    Hp = -(-(height - 1) // step) * step + 1
+    x = _axis(*x_range, width, Wp)
+    y = _axis(*y_range, height, Hp)
+
+    n = np.full((Hp, Wp), -1, dtype=np.int32)
+    abs2 = np.zeros((Hp, Wp))
+    counts = {"computed": 0, "filled": 0}
+    kernel_stats = {} if stats is not None else None
+
+    def compute(J, I):
+        n[J, I], abs2[J, I] = escape_block(x[I] + 1j * y[J], c, max_iter, radius,
+                                           interior_checks, kernel_stats)
+        counts["computed"] += J.size
+
+    def snapshot(s):
+        if s == 1:
+            return 1, n[:height, :width].copy(), abs2[:height, :width].copy()
+        J = (np.arange(height) // s * s)[:, None]
+        I = (np.arange(width) // s * s)[None, :]
+        preview_n, preview_abs2 = n[J, I], abs2[J, I]
+        preview_n[known[:height, :width]] = n[:height, :width][known[:height, :width]]
+        preview_abs2[known[:height, :width]] = abs2[:height, :width][known[:height, :width]]
+        return s, preview_n, preview_abs2
+
+    # Coarse lattice
+    known = np.zeros((Hp, Wp), dtype=bool)
+    J, I = np.meshgrid(np.arange(0, Hp, step), np.arange(0, Wp, step), indexing="ij")
+    compute(J.ravel(), I.ravel())
+    known[J, I] = True
+    yield snapshot(step)
+
+    # Full-resolution grid lines: the borders of the first cells
+    lines = np.zeros((Hp, Wp), dtype=bool)
+    lines[::step, :] = True
+    lines[:, ::step] = True
+    J, I = np.nonzero(lines & ~known)
+    compute(J, I)
+    known |= lines
+
+    j0, i0 = np.meshgrid(np.arange(0, Hp - 1, step), np.arange(0, Wp - 1, step),
+                         indexing="ij")
+    j0, i0 = j0.ravel(), i0.ravel()
+    s = step
+    while s > 1 and j0.size:
+        # Border of every live cell, at full resolution (4s pixels each)
+        t = np.arange(s)
+        bj = np.concatenate([np.zeros(s, int), t, np.full(s, s), s - t])
+        bi = np.concatenate([t, np.full(s, s), s - t, np.zeros(s, int)])
+        border = n[j0[:, None] + bj, i0[:, None] + bi]
+        uniform = (border == border[:, :1]).all(axis=1)
+        if smooth:
+            uniform &= border[:, 0] < 0
+
+        # Fill uniform cells
+        if uniform.any():
+            inner = np.arange(1, s)
+            fj = (j0[uniform][:, None, None] + inner[None, :, None]).repeat(s - 1, axis=2)
+            fi = (i0[uniform][:, None, None] + inner[None, None, :]).repeat(s - 1, axis=1)
+            n[fj, fi] = border[uniform, 0][:, None, None]
+            abs2[fj, fi] = abs2[j0[uniform], i0[uniform]][:, None, None]
+            known[fj, fi] = True
+            counts["filled"] += fj.size
+        j0, i0 = j0[~uniform], i0[~uniform]
+
+        # Split the others: cross through the centre, then four sub-cells
+        h = s // 2
+        row = np.arange(1, s)
+        col = row[row != h]
+        J = np.concatenate([np.repeat(j0 + h, row.size), (j0[:, None] + col).ravel()])
+        I = np.concatenate([(i0[:, None] + row).ravel(), np.repeat(i0 + h, col.size)])
+        if J.size:
+            compute(J, I)
+            known[J, I] = True
+        j0 = np.concatenate([j0, j0 + h, j0, j0 + h])
+        i0 = np.concatenate([i0, i0, i0 + h, i0 + h])
+        s = h
+        if s > 1:
+            yield snapshot(s)
+
+    if stats is not None:
+        for key, value in {**kernel_stats, **counts}.items():
+            stats[key] = stats.get(key, 0) + value
+    yield snapshot(1)
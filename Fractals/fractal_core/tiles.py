@@ -0,0 +1,139 @@
+"""
+Tiled Parallel Renderer
+=======================
+Splits the pixel grid into square tiles and renders them on a process pool.
+Workers attach to two `multiprocessing.shared_memory` buffers (escape count
+and |z|² at escape) and write their tile in place, so no image data is
+pickled back to the parent.
+
+Tiles are not equally expensive: a tile inside the set costs max_iter
+iterations per pixel while one far outside finishes in a few. Each tile's
+cost is first estimated from one coarse sample of the whole grid (a single
+escape-time call, binned per tile) and the tiles are dispatched
+most-expensive first (longest-processing-time scheduling), so the
+pool does not end waiting on one slow tile.
+"""
+
+import os
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from .escape import escape_block, in_main_bulbs
+
+TILE = 128                              # tile edge in pixels
+COST_SAMPLES = 8                        # coarse samples per tile edge
+
+_worker = {}                            # per-process views of the shared buffers
+
+
+def pixel_grid(x_range, y_range, width, height):
+    """Axis coordinates of the grid: pixel (j, i) is x[i] + 1j * y[j]."""
+    return np.linspace(*x_range, width), np.linspace(*y_range, height)
+
+
+def _tiles(width, height, tile):
+    """(row slice, column slice) of every tile."""
+    return [(slice(j, min(j + tile, height)), slice(i, min(i + tile, width)))
+            for j in range(0, height, tile) for i in range(0, width, tile)]
+
+
+def _tile_costs(x, y, tile, c, max_iter, radius, interior_checks):
+    """
+    Estimated iterations of every tile (in _tiles() order), from one coarse
+    subsample of the whole grid: an escaped sample costs its escape count,
+    one caught by the cardioid/bulb test nothing, and the other bounded ones
+    share the remaining iterations equally.
+    """
+    step = max(1, tile // COST_SAMPLES)
+    I, J = np.arange(0, len(x), step), np.arange(0, len(y), step)
+    Z = x[I][None, :] + 1j * y[J][:, None]
+    sample = {}
+    n, _ = escape_block(Z, c, max_iter, radius, interior_checks, sample)
+    iterated = np.ones(n.shape, dtype=bool)
+    if c is None and interior_checks:
+        iterated = ~np.logical_or(*in_main_bulbs(Z))
+    escaped = n >= 0
+    bounded = iterated & ~escaped
+    share = (sample["iterations"] - n[escaped].sum()) / max(bounded.sum(), 1)
+    cost = np.where(escaped, n, np.where(bounded, share, 0.0))
+
+    tiles_x = -(-len(x) // tile)
+    ids = ((J // tile)[:, None] * tiles_x + (I // tile)[None, :]).ravel()
+    n_tiles = tiles_x * -(-len(y) // tile)
+    total = np.bincount(ids, weights=cost.ravel(), minlength=n_tiles)
+    count = np.bincount(ids, minlength=n_tiles)
+    # Tile areas, edge tiles being smaller
+    widths = np.minimum(tile, len(x) - tile * np.arange(tiles_x))
+    heights = np.minimum(tile, len(y) - tile * np.arange(n_tiles // tiles_x))
+    return total / np.maximum(count, 1) * np.outer(heights, widths).ravel()
+
+
+def _attach(names, shape):
+    """Pool initializer: map the shared output buffers into this process."""
+    n_shm, abs2_shm = SharedMemory(name=names[0]), SharedMemory(name=names[1])
+    _worker["shm"] = (n_shm, abs2_shm)        # keep the mappings alive
+    _worker["n"] = np.ndarray(shape, dtype=np.int32, buffer=n_shm.buf)
+    _worker["abs2"] = np.ndarray(shape, dtype=float, buffer=abs2_shm.buf)
+
+
+def _render_tile(job):
+    x, y, rows, cols, c, max_iter, radius, interior_checks = job
+    stats = {}
+    n, abs2 = escape_block(x[None, :] + 1j * y[:, None], c, max_iter, radius,
+                           interior_checks, stats)
+    _worker["n"][rows, cols] = n
+    _worker["abs2"][rows, cols] = abs2
+    return stats
+
+
+def render_escape(x_range, y_range, width, height, c=None, max_iter=1024,
+                  radius=2.0, interior_checks=True, tile=TILE, workers=None,
+                  stats=None):
+    """
+    Escape times over a width × height grid, rendered tile by tile in parallel.
+
+    c               : None for the Mandelbrot set (z₀ = c = pixel), or the
+                      Julia parameter (z₀ = pixel)
+    interior_checks : cardioid/bulb tests (Mandelbrot) and periodicity
+                      checking, see escape.py
+    workers         : pool size (default: all cores); 1 renders in this process
+    stats           : optional dict that receives the summed shortcut counts
+
+    Returns (n, abs2) of shape (height, width), as escape_time() does.
+    """
+    x, y = pixel_grid(x_range, y_range, width, height)
+    tiles = _tiles(width, height, tile)
+    costs = _tile_costs(x, y, tile, c, max_iter, radius, interior_checks)
+    order = np.argsort(costs)[::-1]
+    jobs = [(x[cols], y[rows], rows, cols, c, max_iter, radius, interior_checks)
+            for rows, cols in (tiles[k] for k in order)]
+
+    shape = (height, width)
+    n_shm = SharedMemory(create=True, size=4 * width * height)
+    abs2_shm = SharedMemory(create=True, size=8 * width * height)
+    try:
+        workers = workers or os.cpu_count()
+        if workers == 1:
+            _worker["n"] = np.ndarray(shape, dtype=np.int32, buffer=n_shm.buf)
+            _worker["abs2"] = np.ndarray(shape, dtype=float, buffer=abs2_shm.buf)
+            try:
+                results = [_render_tile(job) for job in jobs]
+            finally:
+                _worker.clear()             # views must go before shm.close()
+        else:
+            names = (n_shm.name, abs2_shm.name)
+            with Pool(workers, initializer=_attach, initargs=(names, shape)) as pool:
+                results = list(pool.imap_unordered(_render_tile, jobs))
+        n = np.frombuffer(n_shm.buf, dtype=np.int32).reshape(shape).copy()
+        abs2 = np.frombuffer(abs2_shm.buf, dtype=float).reshape(shape).copy()
+    finally:
+        for shm in (n_shm, abs2_shm):
+            shm.close()
+            shm.unlink()
+    if stats is not None:
+        for tile_stats in results:
+            for key, value in tile_stats.items():
+                stats[key] = stats.get(key, 0) + value
+    return n, abs2
@@ -0,0 +1,164 @@
+"""
+Zoom Video
+==========
+Renders a zoom into a point as a stream of RGB frames without computing
+every frame from scratch.
+
+Keyframes are rendered at twice the frame's pixel density and halve in width
+from one to the next: keyframe k, with pixel spacing d_k = d_0 / 2^k, serves
+every frame whose spacing lies in (d_k, 2 d_k], each frame being a bilinear
+resample of the coloured keyframe. Because the spacing halves exactly and
+the grids are centred on the zoom point, every other row and column of a
+keyframe coincides with a sample of the previous one: a quarter of each
+keyframe is copied and only the newly revealed three quarters is iterated.
+
+Only the current keyframe is held in memory. Frames are yielded one at a
+time and can be written to numbered PNGs or piped into ffmpeg. Coordinates
+are float64, so zooms stop at a width of about 1e-13 (see perturbation.py
+for deeper single images).
+"""
+
+import itertools
+import shutil
+import subprocess
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from .escape import escape_block
+
+
+def _keyframe(center, d, shape, previous, c, max_iter, radius, interior_checks,
+              stats):
+    """
+    Escape times on an odd-sized grid of spacing d centred on `center`, image
+    orientation (row 0 at the top). `previous` is the (n, abs2) of the
+    keyframe with spacing 2d, whose samples fill the even offsets.
+    """
+    rows, cols = shape
+    hy, hx = rows // 2, cols // 2
+    mx = np.arange(cols) - hx
+    my = hy - np.arange(rows)
+    n = np.full(shape, -1, dtype=np.int32)
+    abs2 = np.zeros(shape)
+    todo = np.ones(shape, dtype=bool)
+    if previous is not None:
+        even_rows = slice(hy % 2, rows, 2)
+        even_cols = slice(hx % 2, cols, 2)
+        src_rows = hy + (np.arange(rows)[even_rows] - hy) // 2
+        src_cols = hx + (np.arange(cols)[even_cols] - hx) // 2
+        n[even_rows, even_cols] = previous[0][np.ix_(src_rows, src_cols)]
+        abs2[even_rows, even_cols] = previous[1][np.ix_(src_rows, src_cols)]
+        todo[even_rows, even_cols] = False
+    J, I = np.nonzero(todo)
+    Z = (center[0] + mx[I] * d) + 1j * (center[1] + my[J] * d)
+    n[J, I], abs2[J, I] = escape_block(Z, c, max_iter, radius, interior_checks, stats)
+    return n, abs2
+
+
+def _resample(image, u, v):
+    """Bilinear sample of an (rows, cols, 3) image at column u, row v."""
+    u0 = np.clip(np.floor(u).astype(int), 0, image.shape[1] - 2)
+    v0 = np.clip(np.floor(v).astype(int), 0, image.shape[0] - 2)
+    fu = (u - u0)[None, :, None]
+    fv = (v - v0)[:, None, None]
+    top = image[v0][:, u0] * (1 - fu) + image[v0][:, u0 + 1] * fu
+    bottom = image[v0 + 1][:, u0] * (1 - fu) + image[v0 + 1][:, u0 + 1] * fu
+    return top * (1 - fv) + bottom * fv
+
+
+def zoom_frames(center, start_width, end_width, n_frames, width, height,
+                colorize, c=None, max_iter=1024, radius=2.0,
+                interior_checks=True, stats=None):
+    """
+    Yield the (height, width, 3) uint8 frames of an exponential zoom.
+
+    center      : (x, y) zoom point
+    start_width : real-axis width of the first frame, end_width of the last
+    colorize    : colorize(n, abs2) → (..., 3) floats in [0, 1], applied to
+                  each keyframe (e.g. smooth_iterations + a colormap)
+    c           : None for the Mandelbrot set, else the Julia parameter
+    stats       : optional dict receiving "keyframes", "computed" and
+                  "reused" sample counts plus the escape kernel's counters
+
+    Zooms in only: end_width must not exceed start_width.
+    """
+    if end_width > start_width:
+        raise ValueError("zoom_frames() zooms in: end_width must be <= start_width")
+    d0 = start_width / (width - 1) / 2
+    shape = (2 * height - 1, 2 * width - 1)
+    hy, hx = height - 1, width - 1
+    shared = len(range(hy % 2, shape[0], 2)) * len(range(hx % 2, shape[1], 2))
+    counts = {"keyframes": 0, "computed": 0, "reused": 0}
+    kernel_stats = {} if stats is not None else None
+
+    key, previous, image = -1, None, None
+    for f in range(n_frames):
+        spacing = (start_width * (end_width / start_width) ** (f / max(n_frames - 1, 1))
+                   / (width - 1))
+        k = max(int(np.floor(np.log2(2 * d0 / spacing) + 1e-9)), 0)
+        while key < k:
+            key += 1
+            reused = shared if previous is not None else 0
+            previous = _keyframe(center, d0 / 2 ** key, shape, previous, c,
+                                 max_iter, radius, interior_checks, kernel_stats)
+            image = np.asarray(colorize(*previous), dtype=np.float32)
+            counts["keyframes"] += 1
+            counts["reused"] += reused
+            counts["computed"] += shape[0] * shape[1] - reused
+        scale = spacing / (d0 / 2 ** key)
+        u = hx + (np.arange(width) - (width - 1) / 2) * scale
+        v = hy + (np.arange(height) - (height - 1) / 2) * scale
+        frame = _resample(image, u, v)
+        yield (np.clip(frame, 0.0, 1.0) * 255).astype(np.uint8)
+
+    if stats is not None:
+        for name, value in {**kernel_stats, **counts}.items():
+            stats[name] = stats.get(name, 0) + value
+
+
+# ─── Frame sinks ───────────────────────────────────────────────────────────────
+def write_image_sequence(frames, directory, pattern="frame_{:05d}.png"):
+    """Save each frame as it arrives; returns the number written."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    count = 0
+    for count, frame in enumerate(frames, start=1):
+        Image.fromarray(frame).save(directory / pattern.format(count - 1))
+    return count
+
+
+def write_video(frames, path, fps=30, crf=18):
+    """
+    Pipe frames as raw RGB into ffmpeg (H.264, yuv420p). Raises RuntimeError
+    if ffmpeg is not on PATH or fails (the frames are then partly consumed).
+    Returns the number of frames written.
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg not found on PATH; use write_image_sequence()")
+    frames = iter(frames)
+    first = next(frames)
+    height, width = first.shape[:2]
+    cmd = [ffmpeg, "-y", "-loglevel", "error",
+           "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}",
+           "-r", str(fps), "-i", "-",
+           "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", str(crf), str(path)]
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+    count = 0
+    try:
+        for frame in itertools.chain([first], frames):
+            proc.stdin.write(np.ascontiguousarray(frame).tobytes())
+            count += 1
+    except BrokenPipeError:
+        pass                            # ffmpeg died; its exit status is reported below
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        status = proc.wait()
+    if status != 0:
+        raise RuntimeError(f"ffmpeg exited with status {status} after {count} frames")
+    return count
@@ -3,12 +3,18 @@ Julia Set Fractal Renderer
 Generates high-resolution images of famous Julia sets.
 """
 
+import sys
+from pathlib import Path
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
 import re
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Iterator, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fractal_core import (render_escape, smooth_iterations, perturbation_escape,
+                          progressive_escape, pixel_grid, FieldStore, recolor)
 
 
 # ─── Configuration ─────────────────────────────────────────────────────────────
@@ -23,6 +29,9 @@ class JuliaConfig:
     max_iter: int = 1024
     escape_radius: float = 2.0
     log_scale_factor: float = 10.0
+    workers: Optional[int] = None    # render processes (None: all cores)
+    interior_checks: bool = True     # retire periodic orbits early
+    store_fields: bool = True        # keep raw escape values in Fractals/.field_cache
 
 
 # ─── Julia Set Renderer ─────────────────────────────────────────────────────────
@@ -30,6 +39,7 @@ class JuliaSetRenderer:
     def __init__(self, config: JuliaConfig):
         self.config = config
         self.colormap = self._create_custom_colormap()
+        self.fields = FieldStore()
 
     def _create_custom_colormap(self) -> LinearSegmentedColormap:
         """Custom gradient color palette."""
@@ -43,22 +53,59 @@ class JuliaSetRenderer:
 
     def compute_julia_set(self, c: complex) -> np.ndarray:
         """Compute escape values for the Julia set."""
-        x = np.linspace(self.config.x_min, self.config.x_max, self.config.width)
-        y = np.linspace(self.config.y_min, self.config.y_max, self.config.height)
-        Z = x[None, :] + 1j * y[:, None]
-        escape_values = np.zeros(Z.shape, dtype=float)
-        mask = np.ones(Z.shape, dtype=bool)
-
-        for i in range(self.config.max_iter):
-            escaped = (np.abs(Z) > self.config.escape_radius) & mask
-            if np.any(escaped):
-                abs_z = np.abs(Z[escaped])
-                nu = np.log(np.log(abs_z) / np.log(2)) / np.log(2)
-                escape_values[escaped] = i + 1 - nu
-                mask[escaped] = False
-            if not np.any(mask):
-                break
-            Z[mask] = Z[mask] ** 2 + c
+        cfg = self.config
+        n, abs2 = render_escape((cfg.x_min, cfg.x_max), (cfg.y_min, cfg.y_max),
+                                cfg.width, cfg.height, c=c, max_iter=cfg.max_iter,
+                                radius=cfg.escape_radius,
+                                interior_checks=cfg.interior_checks, workers=cfg.workers)
+        return self.gallery_values(n, abs2)
+
+    def gallery_values(self, n: np.ndarray, abs2: np.ndarray) -> np.ndarray:
+        """
+        Escape values on the gallery scale, i + 1 - ν after i updates, from
+        escape_time output over the configured view. The gallery tests |z|
+        before each of its max_iter updates: pixels with |z0| > R escape at
+        i = 0, and one first past R after the last update stays bounded.
+        """
+        cfg = self.config
+        x, y = pixel_grid((cfg.x_min, cfg.x_max), (cfg.y_min, cfg.y_max),
+                          cfg.width, cfg.height)
+        start = x[None, :] ** 2 + y[:, None] ** 2
+        outside = start > cfg.escape_radius ** 2
+        n = np.where(outside, 0, np.where(n >= cfg.max_iter, -1, n))
+        abs2 = np.where(outside, start, abs2)
+        escape_values = smooth_iterations(n, abs2)
+        escape_values[n >= 0] += 1
+        return escape_values
+
+    def julia_field(self, c: complex) -> np.ndarray:
+        """Escape values for c, read from the field store when already computed."""
+        if not self.config.store_fields:
+            return self.compute_julia_set(c)
+        cfg = self.config
+        return self.fields.field(
+            lambda: self.compute_julia_set(c), kind="gallery", c=c,
+            x_range=(cfg.x_min, cfg.x_max), y_range=(cfg.y_min, cfg.y_max),
+            width=cfg.width, height=cfg.height, max_iter=cfg.max_iter,
+            radius=cfg.escape_radius, interior_checks=cfg.interior_checks)
+
+    def compute_julia_progressive(self, c: complex) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yield (step, escape values) previews, coarse to fine; step 1 is the final image."""
+        cfg = self.config
+        for step, n, abs2 in progressive_escape(
+                (cfg.x_min, cfg.x_max), (cfg.y_min, cfg.y_max), cfg.width, cfg.height,
+                c=c, max_iter=cfg.max_iter, radius=cfg.escape_radius,
+                interior_checks=cfg.interior_checks):
+            yield step, self.gallery_values(n, abs2)
+
+    def compute_julia_deep_zoom(self, c: complex, center: Tuple[str, str],
+                                span: float) -> np.ndarray:
+        """Escape values of a perturbation-mode zoom of width `span` around `center`."""
+        cfg = self.config
+        n, abs2 = perturbation_escape(center, span, cfg.width, cfg.height, c=c,
+                                      max_iter=cfg.max_iter, radius=cfg.escape_radius)
+        escape_values = smooth_iterations(n, abs2)
+        escape_values[n >= 0] += 1
         return escape_values
 
     def process_escape_values(self, escape_values: np.ndarray) -> np.ma.MaskedArray:
@@ -74,6 +121,13 @@ class JuliaSetRenderer:
         """Fixed color scale for consistent visualization."""
         return 0, np.log(101) * self.config.log_scale_factor
 
+    def colorize(self, escape_values: np.ndarray, cmap=None) -> np.ndarray:
+        """RGB image of escape values: the log scale and colour range above, one pass."""
+        vmin, vmax = self.get_color_range()
+        return recolor(escape_values, cmap or self.colormap,
+                       transform=lambda v: np.log(v + 1) * self.config.log_scale_factor,
+                       vmin=vmin, vmax=vmax)
+
 
 # ─── Gallery  ───────────────────────────────────────────────
 class JuliaSetGallery:
@@ -95,15 +149,11 @@ class JuliaSetGallery:
     def create_single_figure(self, c: complex, name: str, figsize=(10, 10)) -> plt.Figure:
         """Render a single Julia set."""
         fig, ax = plt.subplots(figsize=figsize)
-        escape_values = self.renderer.compute_julia_set(c)
-        processed = self.renderer.process_escape_values(escape_values)
-        vmin, vmax = self.renderer.get_color_range()
+        escape_values = self.renderer.julia_field(c)
         ax.imshow(
-            processed,
+            self.renderer.colorize(escape_values),
             extent=[self.config.x_min, self.config.x_max, self.config.y_min, self.config.y_max],
-            cmap=self.renderer.colormap,
             origin='lower',
-            vmin=vmin, vmax=vmax,
             interpolation='bilinear'
         )
         ax.axis('off')
@@ -1,72 +1,113 @@
+import sys
+from pathlib import Path
 from manim import *
 import numpy as np
 from PIL import Image
-import colorsys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fractal_core import (escape_time, mandelbrot_escape_time, hls_to_rgb, to_uint8,
+                          FrameCache, interpolate_path)
 
 # === CONFIGURATION ===
 MANDELBROT_WIDTH, MANDELBROT_HEIGHT = 1000, 1000
 JULIA_WIDTH, JULIA_HEIGHT = 1000, 1000
 MAX_ITER = 100
-z = 0  # Global var for smooth coloring
+MANDELBROT_X_RANGE, MANDELBROT_Y_RANGE = (-2.0, 0.8), (-1.4, 1.4)
+JULIA_X_RANGE, JULIA_Y_RANGE = (-1.5, 1.5), (-1.5, 1.5)
+MORPH_STEPS = 12      # Julia frames per path segment
+WORKERS = None        # processes for frame precomputation (None = all cores)
+CACHE_NAMESPACE = "MandelbrotJuliaMap"   # same keys whether run directly or by manim
+
+# Animation path
+PATH = [
+    complex(-0.745, 0.113),
+    complex(-1.25, 0),
+    complex(0.285, 0.01),
+    complex(-0.8, 0.156),
+    complex(0.4, 0.4),
+    complex(-0.162, 1.04),
+    complex(-0.70176, -0.3842),
+    complex(0, 0),
+]
 
 # === COLORING ===
-def get_color(n, max_iter):
-    """Return smooth color based on iteration count."""
-    if n == max_iter:
-        return (0, 0, 0)  # black
-    hue = (n + 1 - np.log(np.log(abs(z))) / np.log(2)) / max_iter
+def get_colors(n, abs2, max_iter):
+    """Smooth HLS colours for whole arrays of escape counts; black inside."""
+    inside = n == max_iter
+    log_z = 0.5 * np.log(np.where(inside, np.e, abs2))     # log|z|
+    hue = (n + 1 - np.log(log_z) / np.log(2)) / max_iter
     hue = (hue * 2.5) % 1
-    r, g, b = colorsys.hls_to_rgb(hue, 0.5, 1.0)
-    return (int(r * 255), int(g * 255), int(b * 255))
+    rgb = to_uint8(hls_to_rgb(hue, 0.5, 1.0))
+    rgb[inside] = 0
+    return rgb
 
 # === FRACTAL CORE ===
+def pixel_plane(width, height, x_range, y_range):
+    """Complex value of every pixel; row y, column x, as pixels[x, y] was filled."""
+    x = x_range[0] + np.arange(width) / width * (x_range[1] - x_range[0])
+    y = y_range[0] + np.arange(height) / height * (y_range[1] - y_range[0])
+    return x[None, :] + 1j * y[:, None]
+
+def escape_counts(z0, n_escape, abs2, max_iter):
+    """
+    Convert escape_time() output to this script's convention: |z| > 2 is
+    tested before each update, n counts the updates that came first and
+    bounded pixels get max_iter.
+    """
+    start = z0.real * z0.real + z0.imag * z0.imag
+    n = np.where(n_escape < 0, max_iter, n_escape)
+    n = np.where(start > 4, 0, n)
+    abs2 = np.where(start > 4, start, abs2)
+    return n, abs2
+
 def mandelbrot(c, max_iter):
-    z_val = c
-    for n in range(max_iter):
-        if abs(z_val) > 2:
-            return n, z_val
-        z_val = z_val*z_val + c
-    return max_iter, z_val
+    c = np.asarray(c, dtype=complex)
+    n, abs2 = mandelbrot_escape_time(c, max_iter - 1)
+    return escape_counts(c, n, abs2, max_iter)
 
 def julia(z_val, c, max_iter):
-    for n in range(max_iter):
-        if abs(z_val) > 2:
-            return n, z_val
-        z_val = z_val*z_val + c
-    return max_iter, z_val
+    z_val = np.asarray(z_val, dtype=complex)
+    n, abs2 = escape_time(z_val, c, max_iter - 1, periodicity=True)
+    return escape_counts(z_val, n, abs2, max_iter)
 
 # === FRACTAL IMAGE GENERATION ===
 def generate_mandelbrot_image(width, height, max_iter, x_range=(-2.0, 0.8), y_range=(-1.4, 1.4)):
-    img = Image.new('RGB', (width, height), 'black')
-    pixels = img.load()
-    global z
-    for x in range(width):
-        for y in range(height):
-            c = complex(
-                x_range[0] + (x / width) * (x_range[1] - x_range[0]),
-                y_range[0] + (y / height) * (y_range[1] - y_range[0])
-            )
-            n, z = mandelbrot(c, max_iter)
-            pixels[x, y] = get_color(n, max_iter)
-    return img
+    n, abs2 = mandelbrot(pixel_plane(width, height, x_range, y_range), max_iter)
+    return Image.fromarray(get_colors(n, abs2, max_iter), 'RGB')
 
 def generate_julia_image(c, width, height, max_iter, x_range=(-1.5, 1.5), y_range=(-1.5, 1.5)):
-    img = Image.new('RGB', (width, height), 'black')
-    pixels = img.load()
-    global z
-    for x in range(width):
-        for y in range(height):
-            z_init = complex(
-                x_range[0] + (x / width) * (x_range[1] - x_range[0]),
-                y_range[0] + (y / height) * (y_range[1] - y_range[0])
-            )
-            n, z = julia(z_init, c, max_iter)
-            pixels[x, y] = get_color(n, max_iter)
-    return img
+    n, abs2 = julia(pixel_plane(width, height, x_range, y_range), c, max_iter)
+    return Image.fromarray(get_colors(n, abs2, max_iter), 'RGB')
+
+# === FRAME PRECOMPUTATION ===
+def julia_spec(c):
+    return dict(c=c, width=JULIA_WIDTH, height=JULIA_HEIGHT, max_iter=MAX_ITER,
+                x_range=JULIA_X_RANGE, y_range=JULIA_Y_RANGE)
+
+def precompute_frames(path, cache=None):
+    """
+    Render (or find in the cache) the Mandelbrot image and the Julia frames of
+    the whole path, MORPH_STEPS per segment. Returns the Mandelbrot image
+    path and a list of (segment, c, image path) for the Julia frames.
+    """
+    cache = cache or FrameCache(CACHE_NAMESPACE)
+    mandelbrot_path, = cache.render_frames(
+        generate_mandelbrot_image,
+        [dict(width=MANDELBROT_WIDTH, height=MANDELBROT_HEIGHT, max_iter=MAX_ITER,
+              x_range=MANDELBROT_X_RANGE, y_range=MANDELBROT_Y_RANGE)],
+        workers=1)
+    dense = interpolate_path(path, MORPH_STEPS)
+    julia_paths = cache.render_frames(generate_julia_image,
+                                      [julia_spec(c) for _, c in dense],
+                                      workers=WORKERS)
+    return mandelbrot_path, [(k, c, p) for (k, c), p in zip(dense, julia_paths)]
 
 # === MANIM SCENE ===
 class MandelbrotJuliaMap(Scene):
     def construct(self):
+        # All images come from the frame cache, rendered up front if missing
+        mandelbrot_path, julia_frames = precompute_frames(PATH)
+
         # Titles
         c_text = Text("c = 0.000 + 0.000i", font_size=36)
         title = Text("The Mandelbrot Set as a Map of Julia Sets", font_size=40)
@@ -77,8 +118,7 @@ class MandelbrotJuliaMap(Scene):
         display_scale = 0.85
 
         # Mandelbrot display
-        mandelbrot_img = generate_mandelbrot_image(MANDELBROT_WIDTH, MANDELBROT_HEIGHT, MAX_ITER)
-        mandelbrot_mobject = ImageMobject(mandelbrot_img).scale(display_scale)
+        mandelbrot_mobject = ImageMobject(str(mandelbrot_path)).scale(display_scale)
         mandelbrot_label = Text("Mandelbrot Set").scale(0.7).next_to(mandelbrot_mobject, DOWN, buff=0.2)
         mandelbrot_display = Group(mandelbrot_mobject, mandelbrot_label)
 
@@ -95,50 +135,41 @@ class MandelbrotJuliaMap(Scene):
         self.play(Create(julia_placeholder), Write(julia_label))
         self.wait(1)
 
-        # Animation path
         dot = Dot(color=YELLOW, radius=0.06)
-        path = [
-            complex(-0.745, 0.113),
-            complex(-1.25, 0),
-            complex(0.285, 0.01),
-            complex(-0.8, 0.156),
-            complex(0.4, 0.4),
-            complex(-0.162, 1.04),
-            complex(-0.70176, -0.3842),
-            complex(0, 0),
-        ]
-        x_range_m = (-2.0, 0.8)
-        y_range_m = (-1.4, 1.4)
 
         def get_dot_position(c_val):
-            x_pos = np.interp(c_val.real, x_range_m, [mandelbrot_mobject.get_left()[0], mandelbrot_mobject.get_right()[0]])
-            y_pos = np.interp(c_val.imag, y_range_m, [mandelbrot_mobject.get_bottom()[1], mandelbrot_mobject.get_top()[1]])
+            x_pos = np.interp(c_val.real, MANDELBROT_X_RANGE, [mandelbrot_mobject.get_left()[0], mandelbrot_mobject.get_right()[0]])
+            y_pos = np.interp(c_val.imag, MANDELBROT_Y_RANGE, [mandelbrot_mobject.get_bottom()[1], mandelbrot_mobject.get_top()[1]])
             return [x_pos, y_pos, 0]
 
-        dot.move_to(get_dot_position(path[0]))
+        dot.move_to(get_dot_position(PATH[0]))
         self.play(Create(dot))
 
-        def update_julia(c):
-            julia_img = generate_julia_image(c, JULIA_WIDTH, JULIA_HEIGHT, MAX_ITER)
-            return ImageMobject(julia_img).scale(display_scale).move_to(julia_placeholder)
+        def load_julia(image_path):
+            return ImageMobject(str(image_path)).scale(display_scale).move_to(julia_placeholder)
 
         # Initial Julia
-        julia_mobject_ref = update_julia(path[0])
-        self.play(FadeIn(julia_mobject_ref), run_time=0.5)
-
-        # Loop through points
-        for c_val in path:
-            new_dot_pos = get_dot_position(c_val)
-            new_julia = update_julia(c_val)
-            new_c_text = Text(f"c = {c_val.real:.3f} {c_val.imag:+.3f}i", font_size=36).move_to(c_text)
-
-            self.play(
-                dot.animate.move_to(new_dot_pos),
-                Transform(julia_mobject_ref, new_julia),
-                Transform(c_text, new_c_text),
-                run_time=4
-            )
+        _, c_val, image_path = julia_frames[0]
+        julia_mobject_ref = load_julia(image_path)
+        new_c_text = Text(f"c = {c_val.real:.3f} {c_val.imag:+.3f}i", font_size=36).move_to(c_text)
+        self.play(FadeIn(julia_mobject_ref), Transform(c_text, new_c_text), run_time=0.5)
+        self.wait(2)
+
+        # Morph along each segment of the path through its precomputed frames
+        for segment in range(1, len(PATH)):
+            for _, c_val, image_path in (f for f in julia_frames if f[0] == segment):
+                new_c_text = Text(f"c = {c_val.real:.3f} {c_val.imag:+.3f}i", font_size=36).move_to(c_text)
+                self.play(
+                    dot.animate.move_to(get_dot_position(c_val)),
+                    Transform(julia_mobject_ref, load_julia(image_path)),
+                    Transform(c_text, new_c_text),
+                    run_time=4 / MORPH_STEPS, rate_func=linear
+                )
             self.wait(2)
 
         self.wait(5)
 
+
+if __name__ == "__main__":
+    # Fill the frame cache without rendering the scene
+    precompute_frames(PATH)
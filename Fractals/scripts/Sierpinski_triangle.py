@@ -1,31 +1,29 @@
+import sys
+from pathlib import Path
 import matplotlib.pyplot as plt
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'Chaotic_Systems'))
+from fractal_core import chaos_game, sierpinski
+from chaos_core import DensityGrid
+
 # Vertices of the triangle
 vertices = np.array([[0, 0], [1, 0], [0.5, np.sqrt(3)/2]])
 
-# Initial point
-point = np.array([0.25, 0.25])
-
 #iter
-iterations = 100000
-points = []
+iterations = 10**7
 
-# Chaos Game iteration
-for _ in range(iterations):
-    vertex = vertices[np.random.randint(0, 3)]
-    point = (point + vertex) / 2
-    points.append(point)
-
-# Convert to array
-points = np.array(points)
+# Chaos Game iteration: many walkers at once, each chunk binned into a
+# density grid and dropped, so memory does not grow with `iterations`
+grid = DensityGrid.around(vertices, width=2400, margin=0.02)
+for chunk in chaos_game(sierpinski(vertices), iterations):
+    grid.add_points(chunk)
 
 plt.figure(figsize=(8, 8))
-plt.scatter(points[:, 0], points[:, 1], s=0.1, color='darkblue', alpha=0.5)
+plt.imshow(grid.image('log', color=(0, 0, 0.55)))
 plt.axis('off')
 plt.title("Sierpiński Triangle.", fontsize=16)
-plt.gca().set_aspect('equal')
 plt.tight_layout()
 plt.savefig('Sierpiński Triangle.png',dpi=300)
 plt.show()
-
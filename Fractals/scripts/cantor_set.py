@@ -1,23 +1,22 @@
+import sys
+from pathlib import Path
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
-def draw_cantor(x, y, length, depth, ax, max_depth):
-    if depth == 0:
-        return
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fractal_core import cantor_segments
 
-    ax.hlines(y, x, x + length, color='black', linewidth=2)
-
-    if x == 0.0:
-        ax.text(-0.1, y, f"n = {max_depth - depth + 1}", fontsize=9,
+def draw_cantor(x, y, length, depth, ax):
+    """All construction levels, computed as arrays, as one LineCollection."""
+    segments = cantor_segments(depth, x=x, y=y, length=length, dy=1.0)
+    ax.add_collection(LineCollection(segments, colors='black', linewidths=2))
+    for n in range(1, depth + 1):
+        ax.text(x - 0.1, y - (n - 1), f"n = {n}", fontsize=9,
                 verticalalignment='center', horizontalalignment='right')
 
-    new_length = length / 3
-    new_y = y - 1.0 
-    draw_cantor(x, new_y, new_length, depth - 1, ax, max_depth)
-    draw_cantor(x + 2 * new_length, new_y, new_length, depth - 1, ax, max_depth)
-
 def plot_cantor_set(depth=9):
     fig, ax = plt.subplots(figsize=(10, 6))
-    draw_cantor(x=0.0, y=0.0, length=1.0, depth=depth, ax=ax, max_depth=depth)
+    draw_cantor(x=0.0, y=0.0, length=1.0, depth=depth, ax=ax)
     ax.set_xlim(-0.15, 1.05)  
     ax.set_ylim(-1.1 * (depth + 1), 1)
     ax.axis("off")
@@ -28,4 +27,3 @@ def plot_cantor_set(depth=9):
 
 if __name__ == "__main__":
     plot_cantor_set(depth=9)
-
@@ -1,32 +1,19 @@
+import sys
+from pathlib import Path
 import matplotlib.pyplot as plt
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'Chaotic_Systems'))
+from fractal_core import koch_snowflake
+from chaos_core import DensityGrid
 
-def lsystem_koch_snowflake(iterations):
-    axiom = "F++F++F"
-    rules = {"F": "F-F++F-F"}
-    
-    path = axiom
-    for _ in range(iterations):
-        path = "".join(rules.get(c, c) for c in path)
+MAX_PLOT_SEGMENTS = 2**16      # above this, rasterize instead of ax.plot
 
-    return path
 
-def draw_lsystem(path, angle=60, step=2):
-    x, y = 0.0, 0.0
-    theta = 0.0  # Start facing right
-    coords = [(x, y)]
-
-    for command in path:
-        if command == "F":
-            x += step * np.cos(np.radians(theta))
-            y += step * np.sin(np.radians(theta))
-            coords.append((x, y))
-        elif command == "+":
-            theta += angle
-        elif command == "-":
-            theta -= angle
-    return np.array(coords)
+def draw_lsystem(iterations, step=2):
+    """Vertices of the snowflake, expanded without building the string."""
+    return koch_snowflake().coordinates(iterations, step=step)
 
 def plot(coords, save_as="koch_snowflake.png"):
     plt.figure(figsize=(8, 8))
@@ -37,8 +24,25 @@ def plot(coords, save_as="koch_snowflake.png"):
     plt.savefig(save_as, dpi=300)
     plt.show()
 
+def plot_streamed(iterations, step=2, save_as="koch_snowflake.png"):
+    """Deep iterations: stream the path in chunks into a density grid."""
+    system = koch_snowflake()
+    size = step * 3 ** iterations            # side of the initial triangle
+    corners = np.array([[0, 0], [size, 0], [size / 2, size * np.sqrt(3) / 2],
+                        [size / 2, -size * np.sqrt(3) / 6]])
+    grid = DensityGrid.around(corners, width=2400, margin=0.02)
+    for chunk in system.coordinate_chunks(iterations, step=step):
+        grid.add_polyline(chunk)
+    plt.figure(figsize=(8, 8))
+    plt.imshow(grid.image('log', color=(0, 0, 0.55)))
+    plt.axis("off")
+    plt.tight_layout()
+    plt.savefig(save_as, dpi=300)
+    plt.show()
+
 if __name__ == "__main__":
     iterations = 6
-    path = lsystem_koch_snowflake(iterations)
-    coords = draw_lsystem(path, step=2)
-    plot(coords)
+    if koch_snowflake().segment_count(iterations) <= MAX_PLOT_SEGMENTS:
+        plot(draw_lsystem(iterations, step=2))
+    else:
+        plot_streamed(iterations, step=2)
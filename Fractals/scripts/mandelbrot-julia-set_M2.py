@@ -6,13 +6,24 @@ Generates Mandelbrot and Julia set images with smooth coloring.
 Output:
 - output/mandelbrot.png
 - output/julia_period_<n>.png
+- output/mandelbrot_deep_zoom.png, if RENDER_DEEP_ZOOM
+- output/mandelbrot_zoom.mp4 (or output/zoom_frames/ without ffmpeg), if RENDER_ZOOM
 """
 
 import os
+import shutil
+import sys
+from pathlib import Path
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fractal_core import (mandelbrot_escape_time, smooth_iterations, render_escape,
+                          shortcut_summary, perturbation_escape, progressive_escape,
+                          zoom_frames, write_image_sequence, write_video,
+                          FieldStore, recolor)
+
 # ─── Configuration ────────────────────────────────────────────────────────────
 OUTPUT_DIR = "output"           
 WIDTH, HEIGHT = 1200, 1200       # Image resolution
@@ -26,6 +37,28 @@ MAX_ITER = 1024
 ESCAPE_RADIUS = 2.0
 LOG_SCALE = 10.0
 
+WORKERS = None                   # Render processes (None: all cores)
+INTERIOR_CHECKS = True           # Cardioid/bulb test and periodicity checking
+REPORT_STATS = True              # Print the pixels saved by those shortcuts
+
+# Raw escape fields are stored (Fractals/.field_cache) and recoloured from
+# disk, so changing C_MAP or LOG_SCALE does not re-run the iteration
+FIELDS = FieldStore()
+
+# Deep zoom (perturbation mode): centre as decimal strings, view width;
+# off by default, the high-precision reference orbit takes a while
+RENDER_DEEP_ZOOM = False
+DEEP_ZOOM_CENTER = ("0", "1")    # c = i, a Misiurewicz point
+DEEP_ZOOM_SPAN = 1e-100
+
+# Zoom video (keyframes reused across frames); off by default, takes minutes
+RENDER_ZOOM = False
+ZOOM_CENTER = (-0.743643887037151, 0.131825904205330)   # Seahorse valley
+ZOOM_END_WIDTH = 1e-9
+ZOOM_FRAMES = 600
+ZOOM_SIZE = (1280, 720)          # (width, height)
+ZOOM_FPS = 30
+
 # c-values for Julia sets (periods 0–6)
 C_VALUES = {
     0: 0 + 0j,
@@ -55,97 +88,171 @@ def custom_colormap():
 C_MAP = custom_colormap()
 
 
+def log_scaled(escape):
+    """Log-scaled escape values with the interior masked."""
+    return np.ma.masked_where(escape == 0, np.log(escape + 1) * LOG_SCALE)
+
+
+def colorize(field, cmap=C_MAP):
+    """RGB image of a stored escape field: log scale, colour range 0 … max."""
+    return recolor(field, cmap, transform=lambda v: np.log(v + 1) * LOG_SCALE, vmin=0)
+
+
+def field_meta(c=None):
+    """Metadata naming the escape field of the main view (c=None: Mandelbrot)."""
+    return dict(c=c, x_range=(X_MIN, X_MAX), y_range=(Y_MIN, Y_MAX), width=WIDTH,
+                height=HEIGHT, max_iter=MAX_ITER, radius=ESCAPE_RADIUS,
+                interior_checks=INTERIOR_CHECKS)
+
+
+def save_image(rgb, filename, figsize):
+    """Save a recoloured field of the main view to OUTPUT_DIR."""
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.imshow(
+        rgb, extent=[X_MIN, X_MAX, Y_MIN, Y_MAX],
+        origin='lower', interpolation='bilinear'
+    )
+    ax.axis('off')
+    fig.savefig(f"{OUTPUT_DIR}/{filename}", dpi=300,
+                bbox_inches='tight', facecolor='black')
+    plt.close(fig)
+    print(f"[✔] Saved {filename}")
+
+
 # ─── Mandelbrot ────────────────────────────────────────────────────────────────
 def compute_mandelbrot_escape(X, Y, max_iter=MAX_ITER):
     """Compute smooth escape-time values for Mandelbrot set."""
-    Z = X + 1j * Y
-    C = Z.copy()
-    escape = np.zeros(Z.shape, float)
-    mask = np.ones(Z.shape, bool)
-
-    for i in range(max_iter):
-        Z[mask] = Z[mask] * Z[mask] + C[mask]       # z = z² + c
-        escaped = mask & (np.abs(Z) > ESCAPE_RADIUS)
-        if np.any(escaped):
-            absZ = np.abs(Z[escaped])
-            log_zn = np.log(absZ)
-            nu = np.log(log_zn / np.log(2)) / np.log(2)
-            escape[escaped] = i + 1 - nu            # smooth iteration count
-            mask[escaped] = False
-        if not mask.any():
-            break
+    C = X + 1j * Y
+    n, abs2 = mandelbrot_escape_time(C, max_iter, ESCAPE_RADIUS, INTERIOR_CHECKS)
+    return log_scaled(smooth_iterations(n, abs2))
 
-    return np.ma.masked_where(escape == 0, np.log(escape + 1) * LOG_SCALE)
+
+def mandelbrot_field():
+    """Smooth escape values of the Mandelbrot view, from the field store if present."""
+    def compute():
+        stats = {} if REPORT_STATS else None
+        n, abs2 = render_escape((X_MIN, X_MAX), (Y_MIN, Y_MAX), WIDTH, HEIGHT,
+                                max_iter=MAX_ITER, radius=ESCAPE_RADIUS,
+                                interior_checks=INTERIOR_CHECKS, workers=WORKERS,
+                                stats=stats)
+        if stats:
+            print(f"[i] Mandelbrot shortcuts: {shortcut_summary(stats)}")
+        return smooth_iterations(n, abs2)
+    return FIELDS.field(compute, **field_meta())
 
 
 def render_and_save_mandelbrot():
     """Render and save Mandelbrot image."""
-    x = np.linspace(X_MIN, X_MAX, WIDTH)
-    y = np.linspace(Y_MIN, Y_MAX, HEIGHT)
-    X, Y = np.meshgrid(x, y)
+    save_image(colorize(mandelbrot_field()), "mandelbrot.png", figsize=(10, 10))
+
+
+def compute_progressive_escape(c=None, max_iter=MAX_ITER):
+    """
+    Yield (step, escape) previews of the view, coarse to fine, for interactive
+    use: Mandelbrot if c is None, else the Julia set of c. The first arrives
+    after a few thousand samples; step 1 is the finished image.
+    """
+    for step, n, abs2 in progressive_escape((X_MIN, X_MAX), (Y_MIN, Y_MAX), WIDTH, HEIGHT,
+                                            c=c, max_iter=max_iter, radius=ESCAPE_RADIUS,
+                                            interior_checks=INTERIOR_CHECKS):
+        yield step, log_scaled(smooth_iterations(n, abs2))
+
+
+# ─── Deep zoom ─────────────────────────────────────────────────────────────────
+def compute_deep_zoom_escape(center, span, c=None, max_iter=MAX_ITER):
+    """Smooth escape-time values of a perturbation-mode zoom (Mandelbrot if c is None)."""
+    n, abs2 = perturbation_escape(center, span, WIDTH, HEIGHT, c=c,
+                                  max_iter=max_iter, radius=ESCAPE_RADIUS)
+    return log_scaled(smooth_iterations(n, abs2))
 
-    escape = compute_mandelbrot_escape(X, Y)
+
+def render_and_save_deep_zoom():
+    """Render and save the Mandelbrot deep-zoom image."""
+    escape = compute_deep_zoom_escape(DEEP_ZOOM_CENTER, DEEP_ZOOM_SPAN)
     fig, ax = plt.subplots(figsize=(10, 10))
     ax.imshow(
-        escape, extent=[X_MIN, X_MAX, Y_MIN, Y_MAX],
-        cmap=C_MAP, origin='lower', vmin=0, vmax=escape.max(),
+        escape, cmap=C_MAP, origin='lower', vmin=escape.min(), vmax=escape.max(),
         interpolation='bilinear'
     )
     ax.axis('off')
-    fig.savefig(f"{OUTPUT_DIR}/mandelbrot.png", dpi=300,
+    fig.savefig(f"{OUTPUT_DIR}/mandelbrot_deep_zoom.png", dpi=300,
                 bbox_inches='tight', facecolor='black')
     plt.close(fig)
-    print("[✔] Saved mandelbrot.png")
+    print(f"[✔] Saved mandelbrot_deep_zoom.png (width {DEEP_ZOOM_SPAN:g})")
+
+
+# ─── Zoom video ────────────────────────────────────────────────────────────────
+def zoom_colors(n, abs2):
+    """RGB of the smooth-coloured escape field on a fixed scale (for all frames)."""
+    escape = log_scaled(smooth_iterations(n, abs2))
+    return C_MAP(escape / (np.log(MAX_ITER + 1) * LOG_SCALE))[..., :3]
+
+
+def render_and_save_zoom():
+    """Render the zoom into ZOOM_CENTER as a video (image sequence without ffmpeg)."""
+    stats = {} if REPORT_STATS else None
+
+    def frames():
+        return zoom_frames(ZOOM_CENTER, X_MAX - X_MIN, ZOOM_END_WIDTH, ZOOM_FRAMES,
+                           *ZOOM_SIZE, zoom_colors, max_iter=MAX_ITER,
+                           radius=ESCAPE_RADIUS, interior_checks=INTERIOR_CHECKS,
+                           stats=stats)
+
+    count = None
+    if shutil.which("ffmpeg"):
+        try:
+            count = write_video(frames(), f"{OUTPUT_DIR}/mandelbrot_zoom.mp4", fps=ZOOM_FPS)
+            target = "mandelbrot_zoom.mp4"
+        except RuntimeError as err:
+            print(f"[!] {err}; writing PNG frames instead")
+            if stats:
+                stats.clear()
+    else:
+        print("[!] ffmpeg not found on PATH; writing PNG frames instead")
+    if count is None:
+        # A fresh generator: a failed write_video has consumed the first one
+        count = write_image_sequence(frames(), f"{OUTPUT_DIR}/zoom_frames")
+        target = "zoom_frames/"
+    if stats:
+        print(f"[i] Zoom: {stats['keyframes']} keyframes, "
+              f"{stats['reused']:,} of {stats['reused'] + stats['computed']:,} samples reused")
+    print(f"[✔] Saved {count} frames to {target}")
 
 
 # ─── Julia ─────────────────────────────────────────────────────────────────────
 def compute_julia_escape(c, max_iter=MAX_ITER):
     """Compute smooth escape-time values for Julia set with parameter c."""
-    x = np.linspace(X_MIN, X_MAX, WIDTH)
-    y = np.linspace(Y_MIN, Y_MAX, HEIGHT)
-    X, Y = np.meshgrid(x, y)
-    Z = X + 1j * Y
-
-    escape = np.zeros(Z.shape, float)
-    mask = np.ones(Z.shape, bool)
-
-    for i in range(max_iter):
-        Z[mask] = Z[mask] ** 2 + c                  # z = z² + c
-        escaped = mask & (np.abs(Z) > ESCAPE_RADIUS)
-        if np.any(escaped):
-            absZ = np.abs(Z[escaped])
-            log_zn = np.log(absZ)
-            nu = np.log(log_zn / np.log(2)) / np.log(2)
-            escape[escaped] = i + 1 - nu
-            mask[escaped] = False
-        if not mask.any():
-            break
+    n, abs2 = render_escape((X_MIN, X_MAX), (Y_MIN, Y_MAX), WIDTH, HEIGHT, c=c,
+                            max_iter=max_iter, radius=ESCAPE_RADIUS,
+                            interior_checks=INTERIOR_CHECKS, workers=WORKERS)
+    return log_scaled(smooth_iterations(n, abs2))
 
-    return np.ma.masked_where(escape == 0, np.log(escape + 1) * LOG_SCALE)
+
+def julia_field(c):
+    """Smooth escape values of the Julia set for c, from the field store if present."""
+    def compute():
+        n, abs2 = render_escape((X_MIN, X_MAX), (Y_MIN, Y_MAX), WIDTH, HEIGHT, c=c,
+                                max_iter=MAX_ITER, radius=ESCAPE_RADIUS,
+                                interior_checks=INTERIOR_CHECKS, workers=WORKERS)
+        return smooth_iterations(n, abs2)
+    return FIELDS.field(compute, **field_meta(c))
 
 
 def render_and_save_julia(period, c):
     """Render and save Julia set image for given c-value."""
-    escape = compute_julia_escape(c)
-    fig, ax = plt.subplots(figsize=(8, 8))
-    ax.imshow(
-        escape, extent=[X_MIN, X_MAX, Y_MIN, Y_MAX],
-        cmap=C_MAP, origin='lower', vmin=0, vmax=escape.max(),
-        interpolation='bilinear'
-    )
-    ax.axis('off')
-    fig.savefig(f"{OUTPUT_DIR}/julia_period_{period}.png", dpi=300,
-                bbox_inches='tight', facecolor='black')
-    plt.close(fig)
-    print(f"[✔] Saved julia_period_{period}.png")
+    save_image(colorize(julia_field(c)), f"julia_period_{period}.png", figsize=(8, 8))
 
 
 # ─── Main ──────────────────────────────────────────────────────────────────────
 def main():
     """Generate Mandelbrot and Julia images."""
     render_and_save_mandelbrot()
+    if RENDER_DEEP_ZOOM:
+        render_and_save_deep_zoom()
     for period, c in C_VALUES.items():
         render_and_save_julia(period, c)
+    if RENDER_ZOOM:
+        render_and_save_zoom()
 
 
 if __name__ == "__main__":
@@ -1,21 +1,21 @@
+import sys
+from pathlib import Path
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import LineCollection
 
-def draw_branch(ax, x, y, length, angle, depth, max_depth):
-    if depth > max_depth:
-        return
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fractal_core import binary_tree, level_polylines
 
-    # Compute the end of the current branch
-    x_end = x + length * np.cos(angle)
-    y_end = y + length * np.sin(angle)
-
-    # Line from (x, y) to (x_end, y_end) 
-    ax.plot([x, x_end], [y, y_end], color='black', linewidth=1.2 * (1 - depth / max_depth))
-
-    # Recursively draw the left and right branches
-    new_length = length * 0.7
-    draw_branch(ax, x_end, y_end, new_length, angle + np.pi / 6, depth + 1, max_depth)
-    draw_branch(ax, x_end, y_end, new_length, angle - np.pi / 6, depth + 1, max_depth)
+def draw_tree(ax, x, y, length, angle, max_depth):
+    """All branches, computed level by level, as one LineCollection."""
+    segments, level = binary_tree(max_depth, start=(x, y), length=length, angle=angle,
+                                  scale=0.7, spread=np.pi / 6)
+    # One path per level; branch width depends only on the level
+    widths = 1.2 * (1 - np.arange(max_depth + 1) / max_depth)
+    ax.add_collection(LineCollection(level_polylines(segments, level),
+                                     colors='black', linewidths=widths))
+    ax.autoscale_view()
 
 def main():
     fig, ax = plt.subplots(figsize=(8, 8))
@@ -29,7 +29,7 @@ def main():
 
     max_depth = 15  # Increase for more complexity
 
-    draw_branch(ax, start_x, start_y, init_length, init_angle, 0, max_depth)
+    draw_tree(ax, start_x, start_y, init_length, init_angle, max_depth)
 
     plt.tight_layout()
     plt.savefig("pythagoras_tree.png", dpi=300, bbox_inches='tight')
@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fractal_core import progressive_escape, render_escape
+
+
+@pytest.mark.parametrize("c, x_range", [(None, (-2.0, 1.0)),
+                                        (-0.122561 + 0.744862j, (-1.5, 1.5))])
+@pytest.mark.parametrize("step", [3, 6, 12])
+def test_final_frame_matches_full_render_for_any_step(c, x_range, step):
+    view = (x_range, (-1.5, 1.5), 300, 300)
+    expected, _ = render_escape(*view, c=c, max_iter=256, workers=1)
+    frames = list(progressive_escape(*view, c=c, max_iter=256, step=step))
+    final_step, n, _ = frames[-1]
+    assert final_step == 1
+    assert frames[0][0] >= step
+    np.testing.assert_array_equal(n, expected)
+
+
+def test_step_below_one_is_rejected():
+    with pytest.raises(ValueError):
+        next(progressive_escape((-2, 1), (-1.5, 1.5), 10, 10, step=0))